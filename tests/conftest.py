@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_asyncio import is_async_test
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def pytest_collection_modifyitems(items):
+    """Run every async test on one session-wide event loop instead of a loop per test"""
+    session_scope_marker = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_scope_marker, append=False)
+
+
+@pytest.fixture(scope="session")
+def _shared_session_mock():
+    return AsyncMock(spec=AsyncSession)
+
+
+@pytest.fixture
+def mock_session(_shared_session_mock):
+    """Stand-in for AsyncSession; repositories are patched so it is never queried.
+
+    One AsyncMock is built per session and reset before each test instead of recreated.
+    """
+    _shared_session_mock.reset_mock(return_value=True, side_effect=True)
+    return _shared_session_mock
+
+
+@pytest.fixture
+def patch_repo(monkeypatch):
+    """Replace several async repository methods in one call.
+
+    Usage: ``mocks = patch_repo(CompanyRepository, get_by_id=company, update=None)``.
+    Each keyword installs an ``AsyncMock`` returning the given value; the mocks are
+    returned as attributes of a namespace and restored by monkeypatch at teardown.
+    """
+    def _patch(repo_cls, **methods) -> SimpleNamespace:
+        mocks = {}
+        for name, return_value in methods.items():
+            mocks[name] = AsyncMock(return_value=return_value)
+            monkeypatch.setattr(repo_cls, name, mocks[name])
+        return SimpleNamespace(**mocks)
+
+    return _patch
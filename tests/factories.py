@@ -0,0 +1,159 @@
+"""
+Lightweight stand-ins for ORM models used in service unit tests
+"""
+import itertools
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import UUID
+
+# Fixed timestamp: service tests never depend on the real clock
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# Starts well above the hand-written UUID(int=...) constants used in some tests
+_uid_counter = itertools.count(1 << 32)
+
+
+def next_uuid() -> UUID:
+    """Unique, deterministic ID for tests; no urandom read like uuid4()"""
+    return UUID(int=next(_uid_counter))
+
+
+def _timestamps() -> dict:
+    return {"created_at": NOW, "updated_at": NOW}
+
+
+def fake_user(**overrides) -> SimpleNamespace:
+    """User-like object without SQLAlchemy instrumentation"""
+    return SimpleNamespace(**{
+        "id": next_uuid(),
+        "email": "user@test.com",
+        "username": "user",
+        "is_active": True,
+        "is_superuser": False,
+        "hashed_password": "hashed",
+        **_timestamps(),
+        **overrides,
+    })
+
+
+def fake_company(**overrides) -> SimpleNamespace:
+    """Company-like object without SQLAlchemy instrumentation"""
+    return SimpleNamespace(**{
+        "id": next_uuid(),
+        "name": "Test Company",
+        "description": None,
+        "owner_id": next_uuid(),
+        "is_visible": True,
+        **_timestamps(),
+        **overrides,
+    })
+
+
+def fake_member(**overrides) -> SimpleNamespace:
+    """CompanyMember-like object without SQLAlchemy instrumentation"""
+    return SimpleNamespace(**{
+        "id": next_uuid(),
+        "user_id": next_uuid(),
+        "company_id": next_uuid(),
+        "is_admin": False,
+        **_timestamps(),
+        **overrides,
+    })
+
+
+def fake_invitation(**overrides) -> SimpleNamespace:
+    """CompanyInvitation-like object without SQLAlchemy instrumentation"""
+    from app.models.company_invitation import InvitationStatus
+
+    return SimpleNamespace(**{
+        "id": next_uuid(),
+        "company_id": next_uuid(),
+        "invited_user_id": next_uuid(),
+        "invited_by_id": next_uuid(),
+        "status": InvitationStatus.PENDING,
+        **_timestamps(),
+        **overrides,
+    })
+
+
+def fake_request(**overrides) -> SimpleNamespace:
+    """CompanyRequest-like object without SQLAlchemy instrumentation"""
+    from app.models.company_request import RequestStatus
+
+    return SimpleNamespace(**{
+        "id": next_uuid(),
+        "company_id": next_uuid(),
+        "user_id": next_uuid(),
+        "status": RequestStatus.PENDING,
+        **_timestamps(),
+        **overrides,
+    })
+
+
+def fake_notification(**overrides) -> SimpleNamespace:
+    """Notification-like object without SQLAlchemy instrumentation"""
+    return SimpleNamespace(**{
+        "id": next_uuid(),
+        "user_id": next_uuid(),
+        "message": "Test notification",
+        "notification_type": "quiz_created",
+        "is_read": False,
+        "read_at": None,
+        "related_entity_id": None,
+        **_timestamps(),
+        **overrides,
+    })
+
+
+def fake_quiz(**overrides) -> SimpleNamespace:
+    """Quiz-like object without SQLAlchemy instrumentation"""
+    return SimpleNamespace(**{
+        "id": next_uuid(),
+        "company_id": next_uuid(),
+        "title": "Quiz",
+        "description": None,
+        "frequency": 0,
+        "questions": [],
+        **_timestamps(),
+        **overrides,
+    })
+
+
+def fake_question(**overrides) -> SimpleNamespace:
+    """Question-like object without SQLAlchemy instrumentation"""
+    return SimpleNamespace(**{
+        "id": next_uuid(),
+        "quiz_id": next_uuid(),
+        "title": "Question",
+        "order": 0,
+        "answers": [],
+        **_timestamps(),
+        **overrides,
+    })
+
+
+def fake_answer(**overrides) -> SimpleNamespace:
+    """Answer-like object without SQLAlchemy instrumentation"""
+    return SimpleNamespace(**{
+        "id": next_uuid(),
+        "question_id": next_uuid(),
+        "text": "Answer",
+        "is_correct": False,
+        "order": 0,
+        **_timestamps(),
+        **overrides,
+    })
+
+
+def fake_quiz_attempt(**overrides) -> SimpleNamespace:
+    """QuizAttempt-like object without SQLAlchemy instrumentation"""
+    return SimpleNamespace(**{
+        "id": next_uuid(),
+        "user_id": next_uuid(),
+        "quiz_id": next_uuid(),
+        "company_id": next_uuid(),
+        "score": 0,
+        "total_questions": 0,
+        **_timestamps(),
+        **overrides,
+    })
@@ -0,0 +1,23 @@
+"""
+Small helpers shared by the service unit tests
+"""
+
+
+def async_return(value=None):
+    """Cheap replacement for AsyncMock(return_value=value).
+
+    Returns a coroutine function that records its calls in ``.calls``. When patched
+    onto a class it is bound like a regular method, so recorded args start with the
+    repository instance. Use AsyncMock instead where call assertions are needed.
+    """
+    async def _stub(*args, **kwargs):
+        _stub.calls.append((args, kwargs))
+        return value
+
+    _stub.calls = []
+    return _stub
+
+
+def assert_http(exc_info, status_code: int, detail: str):
+    """Assert that a pytest.raises(HTTPException) block caught the expected error"""
+    assert (exc_info.value.status_code, exc_info.value.detail) == (status_code, detail)
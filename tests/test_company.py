@@ -4,23 +4,6 @@ Tests for company CRUD operations
 import pytest
 
 
-def test_company_service_methods_exist():
-    """Test that CompanyService has all required methods"""
-    from app.services.company import CompanyService
-
-    assert hasattr(CompanyService, 'create_company')
-    assert hasattr(CompanyService, 'get_all_companies')
-    assert hasattr(CompanyService, 'get_company_by_id')
-    assert hasattr(CompanyService, 'update_company')
-    assert hasattr(CompanyService, 'delete_company')
-
-    assert callable(getattr(CompanyService, 'create_company'))
-    assert callable(getattr(CompanyService, 'get_all_companies'))
-    assert callable(getattr(CompanyService, 'get_company_by_id'))
-    assert callable(getattr(CompanyService, 'update_company'))
-    assert callable(getattr(CompanyService, 'delete_company'))
-
-
 def test_company_schemas_exist():
     """Test that company schemas are defined"""
     from app.schemas.company import (
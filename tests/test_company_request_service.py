@@ -1,7 +1,7 @@
 import pytest
-from unittest.mock import AsyncMock, patch
-from uuid import uuid4
-from datetime import datetime, timezone
+from dataclasses import dataclass
+from types import SimpleNamespace
+from uuid import UUID, uuid4
 from fastapi import HTTPException
 from app.services.company_request_service import CompanyRequestService
 from app.repositories.company import CompanyRepository
@@ -9,570 +9,235 @@ from app.repositories.company_member import CompanyMemberRepository
 from app.repositories.company_request import CompanyRequestRepository
 from app.models.user import User
 from app.models.company import Company
-from app.models.company_member import CompanyMember
 from app.models.company_request import CompanyRequest, RequestStatus
+from tests.factories import NOW, fake_company, fake_member, fake_request, fake_user
+from tests.helpers import assert_http
+
+
+@dataclass
+class OwnerScenario:
+    """Company owned by owner, with a request from requester"""
+    company_id: UUID
+    owner: SimpleNamespace
+    requester: SimpleNamespace
+    company: SimpleNamespace
+    request_id: UUID
+    request: SimpleNamespace
+
+
+def arrange_owner_scenario(status: RequestStatus = RequestStatus.PENDING) -> OwnerScenario:
+    owner = fake_user(email="owner@test.com", username="owner")
+    requester = fake_user()
+    company = fake_company(owner_id=owner.id)
+    request = fake_request(company_id=company.id, user_id=requester.id, status=status)
+    return OwnerScenario(
+        company_id=company.id,
+        owner=owner,
+        requester=requester,
+        company=company,
+        request_id=request.id,
+        request=request,
+    )
+
+
+@pytest.fixture
+def service(mock_session):
+    return CompanyRequestService(mock_session)
+
+
+@pytest.fixture
+def patched_repos(patch_repo):
+    """Every repository method the service touches, returning None unless a test sets it"""
+    company_repo = patch_repo(CompanyRepository, get_by_id=None)
+    member_repo = patch_repo(CompanyMemberRepository, get_by_user_and_company=None, create=None)
+    request_repo = patch_repo(
+        CompanyRequestRepository,
+        get_by_id=None,
+        get_pending_request=None,
+        create=None,
+        update=None,
+        get_company_requests=None,
+        count_company_requests=None,
+        get_user_requests=None,
+        count_user_requests=None,
+    )
+    return SimpleNamespace(
+        get_company=company_repo.get_by_id,
+        get_member=member_repo.get_by_user_and_company,
+        create_member=member_repo.create,
+        get_request=request_repo.get_by_id,
+        get_pending=request_repo.get_pending_request,
+        create_request=request_repo.create,
+        update_request=request_repo.update,
+        get_company_requests=request_repo.get_company_requests,
+        count_company_requests=request_repo.count_company_requests,
+        get_user_requests=request_repo.get_user_requests,
+        count_user_requests=request_repo.count_user_requests,
+    )
 
 
-@pytest.mark.asyncio
 class TestCompanyRequestService:
     """Tests for CompanyRequestService"""
 
-    async def test_create_request_success(self):
+    async def test_create_request_success(self, service, patched_repos):
         """Test user successfully creates request to join company"""
-        mock_session = AsyncMock()
         company_id = uuid4()
         user_id = uuid4()
 
-        mock_user = User(
-            id=user_id,
-            email="user@test.com",
-            username="user",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        mock_user = fake_user(id=user_id)
+        mock_company = fake_company(id=company_id, owner_id=uuid4())
+        created_request = fake_request(id=uuid4(), company_id=company_id, user_id=user_id)
 
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=uuid4(),
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        patched_repos.get_company.return_value = mock_company
+        patched_repos.create_request.return_value = created_request
 
-        created_request = CompanyRequest(
-            id=uuid4(),
-            company_id=company_id,
-            user_id=user_id,
-            status=RequestStatus.PENDING,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        result = await service.create_request(company_id, mock_user)
 
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(CompanyMemberRepository, 'get_by_user_and_company',
-                              new_callable=AsyncMock) as mock_get_member:
-                with patch.object(CompanyRequestRepository, 'get_pending_request',
-                                  new_callable=AsyncMock) as mock_get_pending:
-                    with patch.object(CompanyRequestRepository, 'create', new_callable=AsyncMock) as mock_create:
-                        mock_get_company.return_value = mock_company
-                        mock_get_member.return_value = None
-                        mock_get_pending.return_value = None
-                        mock_create.return_value = created_request
-
-                        service = CompanyRequestService(mock_session)
-                        result = await service.create_request(company_id, mock_user)
-
-                        assert result.user_id == user_id
-                        assert result.status == RequestStatus.PENDING
-                        mock_create.assert_called_once()
-
-    async def test_create_request_user_already_member(self):
-        """Test create request fails when user is already a member"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        user_id = uuid4()
-
-        mock_user = User(
-            id=user_id,
-            email="user@test.com",
-            username="user",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        assert result.user_id == user_id
+        assert result.status == RequestStatus.PENDING
+        patched_repos.create_request.assert_called_once()
 
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=uuid4(),
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        mock_member = CompanyMember(
-            id=uuid4(),
-            user_id=user_id,
-            company_id=company_id,
-            is_admin=False,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(CompanyMemberRepository, 'get_by_user_and_company',
-                              new_callable=AsyncMock) as mock_get_member:
-                mock_get_company.return_value = mock_company
-                mock_get_member.return_value = mock_member
-
-                service = CompanyRequestService(mock_session)
-
-                with pytest.raises(HTTPException) as exc_info:
-                    await service.create_request(company_id, mock_user)
-
-                assert exc_info.value.status_code == 400
-                assert exc_info.value.detail == "User is already a member"
-
-    async def test_create_request_already_sent(self):
-        """Test create request fails when request already exists"""
-        mock_session = AsyncMock()
+    async def test_create_request_with_orm_models(self, service, patched_repos):
+        """Test create request against real ORM instances to catch model/schema drift"""
         company_id = uuid4()
         user_id = uuid4()
 
         mock_user = User(
-            id=user_id,
-            email="user@test.com",
-            username="user",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
+            id=user_id, email="user@test.com", username="user", is_active=True, is_superuser=False,
+            hashed_password="hashed", created_at=NOW, updated_at=NOW
         )
-
         mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=uuid4(),
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
+            id=company_id, name="Test Company", owner_id=uuid4(), is_visible=True, created_at=NOW, updated_at=NOW
         )
-
-        existing_request = CompanyRequest(
-            id=uuid4(),
-            company_id=company_id,
-            user_id=user_id,
-            status=RequestStatus.PENDING,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
+        created_request = CompanyRequest(
+            id=uuid4(), company_id=company_id, user_id=user_id, status=RequestStatus.PENDING,
+            created_at=NOW, updated_at=NOW
         )
 
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(CompanyMemberRepository, 'get_by_user_and_company',
-                              new_callable=AsyncMock) as mock_get_member:
-                with patch.object(CompanyRequestRepository, 'get_pending_request',
-                                  new_callable=AsyncMock) as mock_get_pending:
-                    mock_get_company.return_value = mock_company
-                    mock_get_member.return_value = None
-                    mock_get_pending.return_value = existing_request
+        patched_repos.get_company.return_value = mock_company
+        patched_repos.create_request.return_value = created_request
 
-                    service = CompanyRequestService(mock_session)
+        result = await service.create_request(company_id, mock_user)
 
-                    with pytest.raises(HTTPException) as exc_info:
-                        await service.create_request(company_id, mock_user)
+        assert result.id == created_request.id
+        assert result.status == RequestStatus.PENDING
 
-                    assert exc_info.value.status_code == 400
-                    assert exc_info.value.detail == "Request already sent"
-
-    async def test_cancel_request_success(self):
-        """Test user successfully cancels their request"""
-        mock_session = AsyncMock()
+    async def test_create_request_user_already_member(self, service, patched_repos):
+        """Test create request fails when user is already a member"""
         company_id = uuid4()
         user_id = uuid4()
-        request_id = uuid4()
-
-        mock_user = User(
-            id=user_id,
-            email="user@test.com",
-            username="user",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
 
-        mock_request = CompanyRequest(
-            id=request_id,
-            company_id=company_id,
-            user_id=user_id,
-            status=RequestStatus.PENDING,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        mock_user = fake_user(id=user_id)
+        mock_company = fake_company(id=company_id, owner_id=uuid4())
+        mock_member = fake_member(id=uuid4(), user_id=user_id, company_id=company_id)
 
-        with patch.object(CompanyRequestRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_request:
-            with patch.object(CompanyRequestRepository, 'update', new_callable=AsyncMock) as mock_update:
-                mock_get_request.return_value = mock_request
+        patched_repos.get_company.return_value = mock_company
+        patched_repos.get_member.return_value = mock_member
 
-                service = CompanyRequestService(mock_session)
-                await service.cancel_request(company_id, request_id, mock_user)
+        with pytest.raises(HTTPException) as exc_info:
+            await service.create_request(company_id, mock_user)
 
-                assert mock_request.status == RequestStatus.CANCELLED
-                mock_update.assert_called_once()
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "User is already a member"
 
-    async def test_cancel_request_not_pending(self):
-        """Test cancel fails when request is not pending"""
-        mock_session = AsyncMock()
+    async def test_create_request_already_sent(self, service, patched_repos):
+        """Test create request fails when request already exists"""
         company_id = uuid4()
         user_id = uuid4()
-        request_id = uuid4()
-
-        mock_user = User(
-            id=user_id,
-            email="user@test.com",
-            username="user",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        mock_request = CompanyRequest(
-            id=request_id,
-            company_id=company_id,
-            user_id=user_id,
-            status=RequestStatus.ACCEPTED,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
 
-        with patch.object(CompanyRequestRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_request:
-            mock_get_request.return_value = mock_request
+        mock_user = fake_user(id=user_id)
+        mock_company = fake_company(id=company_id, owner_id=uuid4())
+        existing_request = fake_request(id=uuid4(), company_id=company_id, user_id=user_id)
 
-            service = CompanyRequestService(mock_session)
+        patched_repos.get_company.return_value = mock_company
+        patched_repos.get_pending.return_value = existing_request
 
-            with pytest.raises(HTTPException) as exc_info:
-                await service.cancel_request(company_id, request_id, mock_user)
+        with pytest.raises(HTTPException) as exc_info:
+            await service.create_request(company_id, mock_user)
 
-            assert exc_info.value.status_code == 400
-            assert exc_info.value.detail == "Can only cancel pending requests"
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "Request already sent"
 
-    async def test_get_company_requests_success(self):
+    async def test_get_company_requests_success(self, service, patched_repos):
         """Test owner gets list of company requests"""
-        mock_session = AsyncMock()
         company_id = uuid4()
         owner_id = uuid4()
 
-        mock_owner = User(
-            id=owner_id,
-            email="owner@test.com",
-            username="owner",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        mock_owner = fake_user(id=owner_id, email="owner@test.com", username="owner")
+        mock_company = fake_company(id=company_id, owner_id=owner_id)
+        mock_requests = [fake_request(id=uuid4(), company_id=company_id, user_id=uuid4())]
 
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=owner_id,
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        patched_repos.get_company.return_value = mock_company
+        patched_repos.get_company_requests.return_value = mock_requests
+        patched_repos.count_company_requests.return_value = 1
 
-        mock_requests = [
-            CompanyRequest(
-                id=uuid4(),
-                company_id=company_id,
-                user_id=uuid4(),
-                status=RequestStatus.PENDING,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
-            )
-        ]
-
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(CompanyRequestRepository, 'get_company_requests',
-                              new_callable=AsyncMock) as mock_get_requests:
-                with patch.object(CompanyRequestRepository, 'count_company_requests',
-                                  new_callable=AsyncMock) as mock_count:
-                    mock_get_company.return_value = mock_company
-                    mock_get_requests.return_value = mock_requests
-                    mock_count.return_value = 1
-
-                    service = CompanyRequestService(mock_session)
-                    result = await service.get_company_requests(company_id, mock_owner, skip=0, limit=100)
-
-                    assert result.total == 1
-                    assert len(result.requests) == 1
-
-    async def test_get_user_requests_success(self):
-        """Test user gets list of their requests"""
-        mock_session = AsyncMock()
-        user_id = uuid4()
+        result = await service.get_company_requests(company_id, mock_owner, skip=0, limit=100)
 
-        mock_user = User(
-            id=user_id,
-            email="user@test.com",
-            username="user",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        assert result.total == 1
+        assert len(result.requests) == 1
 
-        mock_requests = [
-            CompanyRequest(
-                id=uuid4(),
-                company_id=uuid4(),
-                user_id=user_id,
-                status=RequestStatus.PENDING,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
-            )
-        ]
-
-        with patch.object(CompanyRequestRepository, 'get_user_requests', new_callable=AsyncMock) as mock_get_requests:
-            with patch.object(CompanyRequestRepository, 'count_user_requests', new_callable=AsyncMock) as mock_count:
-                mock_get_requests.return_value = mock_requests
-                mock_count.return_value = 1
-
-                service = CompanyRequestService(mock_session)
-                result = await service.get_user_requests(mock_user, skip=0, limit=100)
-
-                assert result.total == 1
-                assert len(result.requests) == 1
-
-    async def test_accept_request_success(self):
-        """Test owner successfully accepts request"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        owner_id = uuid4()
+    async def test_get_user_requests_success(self, service, patched_repos):
+        """Test user gets list of their requests"""
         user_id = uuid4()
-        request_id = uuid4()
-
-        mock_owner = User(
-            id=owner_id,
-            email="owner@test.com",
-            username="owner",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
 
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=owner_id,
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        mock_request = CompanyRequest(
-            id=request_id,
-            company_id=company_id,
-            user_id=user_id,
-            status=RequestStatus.PENDING,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(CompanyRequestRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_request:
-                with patch.object(CompanyMemberRepository, 'get_by_user_and_company',
-                                  new_callable=AsyncMock) as mock_get_member:
-                    with patch.object(CompanyMemberRepository, 'create', new_callable=AsyncMock) as mock_create_member:
-                        with patch.object(CompanyRequestRepository, 'update',
-                                          new_callable=AsyncMock) as mock_update_request:
-                            mock_get_company.return_value = mock_company
-                            mock_get_request.return_value = mock_request
-                            mock_get_member.return_value = None
-
-                            service = CompanyRequestService(mock_session)
-                            await service.accept_request(company_id, request_id, mock_owner)
-
-                            assert mock_request.status == RequestStatus.ACCEPTED
-                            mock_create_member.assert_called_once()
-                            mock_update_request.assert_called_once()
-
-    async def test_accept_request_not_pending(self):
-        """Test accept fails when request is not pending"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        owner_id = uuid4()
-        request_id = uuid4()
-
-        mock_owner = User(
-            id=owner_id,
-            email="owner@test.com",
-            username="owner",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=owner_id,
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        mock_request = CompanyRequest(
-            id=request_id,
-            company_id=company_id,
-            user_id=uuid4(),
-            status=RequestStatus.DECLINED,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        mock_user = fake_user(id=user_id)
+        mock_requests = [fake_request(id=uuid4(), company_id=uuid4(), user_id=user_id)]
 
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(CompanyRequestRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_request:
-                mock_get_company.return_value = mock_company
-                mock_get_request.return_value = mock_request
+        patched_repos.get_user_requests.return_value = mock_requests
+        patched_repos.count_user_requests.return_value = 1
 
-                service = CompanyRequestService(mock_session)
+        result = await service.get_user_requests(mock_user, skip=0, limit=100)
 
-                with pytest.raises(HTTPException) as exc_info:
-                    await service.accept_request(company_id, request_id, mock_owner)
+        assert result.total == 1
+        assert len(result.requests) == 1
 
-                assert exc_info.value.status_code == 400
-                assert exc_info.value.detail == "Request is not pending"
-
-    async def test_accept_request_not_found(self):
+    async def test_accept_request_not_found(self, service, patched_repos):
         """Test accept fails when request doesn't exist"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        owner_id = uuid4()
-        request_id = uuid4()
-
-        mock_owner = User(
-            id=owner_id,
-            email="owner@test.com",
-            username="owner",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=owner_id,
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(CompanyRequestRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_request:
-                mock_get_company.return_value = mock_company
-                mock_get_request.return_value = None
-
-                service = CompanyRequestService(mock_session)
-
-                with pytest.raises(HTTPException) as exc_info:
-                    await service.accept_request(company_id, request_id, mock_owner)
-
-                assert exc_info.value.status_code == 404
-                assert exc_info.value.detail == "Request not found"
-
-    async def test_decline_request_success(self):
-        """Test owner successfully declines request"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        owner_id = uuid4()
-        request_id = uuid4()
-
-        mock_owner = User(
-            id=owner_id,
-            email="owner@test.com",
-            username="owner",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=owner_id,
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        mock_request = CompanyRequest(
-            id=request_id,
-            company_id=company_id,
-            user_id=uuid4(),
-            status=RequestStatus.PENDING,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(CompanyRequestRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_request:
-                with patch.object(CompanyRequestRepository, 'update', new_callable=AsyncMock) as mock_update:
-                    mock_get_company.return_value = mock_company
-                    mock_get_request.return_value = mock_request
-
-                    service = CompanyRequestService(mock_session)
-                    await service.decline_request(company_id, request_id, mock_owner)
-
-                    assert mock_request.status == RequestStatus.DECLINED
-                    mock_update.assert_called_once()
-
-    async def test_decline_request_not_pending(self):
-        """Test decline fails when request is not pending"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        owner_id = uuid4()
-        request_id = uuid4()
-
-        mock_owner = User(
-            id=owner_id,
-            email="owner@test.com",
-            username="owner",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=owner_id,
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        mock_request = CompanyRequest(
-            id=request_id,
-            company_id=company_id,
-            user_id=uuid4(),
-            status=RequestStatus.ACCEPTED,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(CompanyRequestRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_request:
-                mock_get_company.return_value = mock_company
-                mock_get_request.return_value = mock_request
-
-                service = CompanyRequestService(mock_session)
-
-                with pytest.raises(HTTPException) as exc_info:
-                    await service.decline_request(company_id, request_id, mock_owner)
-
-                assert exc_info.value.status_code == 400
-                assert exc_info.value.detail == "Request is not pending"
+        s = arrange_owner_scenario()
+
+        patched_repos.get_company.return_value = s.company
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.accept_request(s.company_id, s.request_id, s.owner)
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Request not found"
+
+    @pytest.mark.parametrize("method_name, caller, final_status, creates_member", [
+        ("cancel_request", "requester", RequestStatus.CANCELLED, False),
+        ("accept_request", "owner", RequestStatus.ACCEPTED, True),
+        ("decline_request", "owner", RequestStatus.DECLINED, False),
+    ])
+    async def test_transition_pending_request(
+            self, service, patched_repos, method_name, caller, final_status, creates_member
+    ):
+        """Test requester cancels, and owner accepts/declines, a pending request"""
+        s = arrange_owner_scenario()
+
+        patched_repos.get_company.return_value = s.company
+        patched_repos.get_request.return_value = s.request
+
+        await getattr(service, method_name)(s.company_id, s.request_id, getattr(s, caller))
+
+        assert s.request.status == final_status
+        assert patched_repos.create_member.called is creates_member
+        patched_repos.update_request.assert_called_once()
+
+    @pytest.mark.parametrize("method_name, caller, status, detail", [
+        ("cancel_request", "requester", RequestStatus.ACCEPTED, "Can only cancel pending requests"),
+        ("accept_request", "owner", RequestStatus.DECLINED, "Request is not pending"),
+        ("decline_request", "owner", RequestStatus.ACCEPTED, "Request is not pending"),
+    ])
+    async def test_transition_rejected_when_not_pending(self, service, patched_repos, method_name, caller, status, detail):
+        """Test cancel/accept/decline fail when request is no longer pending"""
+        s = arrange_owner_scenario(status=status)
+
+        patched_repos.get_company.return_value = s.company
+        patched_repos.get_request.return_value = s.request
+
+        with pytest.raises(HTTPException) as exc_info:
+            await getattr(service, method_name)(s.company_id, s.request_id, getattr(s, caller))
+
+        assert_http(exc_info, 400, detail)
+        assert s.request.status == status
+        patched_repos.update_request.assert_not_called()
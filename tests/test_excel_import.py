@@ -4,15 +4,26 @@ from openpyxl import Workbook
 
 from app.services.excel_import_service import ExcelImportService
 
+COLUMNS = ['quiz_title', 'quiz_description', 'question_text', 'question_order',
+           'answer_text', 'is_correct', 'answer_order']
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
+def excel_service():
+    """Parsing and validation never touch the DB, so one service serves every test"""
+    class MockDB:
+        pass
+
+    return ExcelImportService(MockDB())
+
+
+@pytest.fixture(scope="session")
 def valid_excel_bytes():
     """Create a valid Excel file for testing"""
     wb = Workbook()
     ws = wb.active
 
-    ws.append(['quiz_title', 'quiz_description', 'question_text', 'question_order',
-               'answer_text', 'is_correct', 'answer_order'])
+    ws.append(COLUMNS)
 
     ws.append(['Python Basics', 'Intro to Python', 'What is Python?', 1,
                'A programming language', True, 1])
@@ -30,7 +41,7 @@ def valid_excel_bytes():
     return excel_bytes.read()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def invalid_excel_missing_columns():
     """Create Excel file with missing required columns"""
     wb = Workbook()
@@ -46,55 +57,61 @@ def invalid_excel_missing_columns():
     return excel_bytes.read()
 
 
-@pytest.fixture
-def invalid_excel_too_few_questions():
-    """Create Excel file with only 1 question (minimum is 2)"""
-    wb = Workbook()
-    ws = wb.active
+def _rows(*values):
+    """Build rows shaped like ExcelImportService._parse_excel output"""
+    return [dict(zip(COLUMNS, row)) for row in values]
 
-    ws.append(['quiz_title', 'quiz_description', 'question_text', 'question_order',
-               'answer_text', 'is_correct', 'answer_order'])
-    ws.append(['Python', 'Test', 'What is it?', 1, 'Language', True, 1])
-    ws.append(['Python', 'Test', 'What is it?', 1, 'Snake', False, 2])
 
-    excel_bytes = io.BytesIO()
-    wb.save(excel_bytes)
-    excel_bytes.seek(0)
-
-    return excel_bytes.read()
+@pytest.fixture
+def valid_rows():
+    return _rows(
+        ('Python Basics', 'Intro to Python', 'What is Python?', 1, 'A programming language', True, 1),
+        ('Python Basics', 'Intro to Python', 'What is Python?', 1, 'A snake', False, 2),
+        ('Python Basics', 'Intro to Python', 'Is Python easy?', 2, 'Yes', True, 1),
+        ('Python Basics', 'Intro to Python', 'Is Python easy?', 2, 'No', False, 2),
+    )
 
 
 @pytest.fixture
-def invalid_excel_no_correct_answer():
-    """Create Excel file with question that has no correct answer"""
-    wb = Workbook()
-    ws = wb.active
+def too_few_rows():
+    """Only 1 question (minimum is 2)"""
+    return _rows(
+        ('Python', 'Test', 'What is it?', 1, 'Language', True, 1),
+        ('Python', 'Test', 'What is it?', 1, 'Snake', False, 2),
+    )
 
-    ws.append(['quiz_title', 'quiz_description', 'question_text', 'question_order',
-               'answer_text', 'is_correct', 'answer_order'])
-    ws.append(['Python', 'Test', 'What is it?', 1, 'Language', False, 1])
-    ws.append(['Python', 'Test', 'What is it?', 1, 'Snake', False, 2])
-    ws.append(['Python', 'Test', 'Is it easy?', 2, 'Yes', True, 1])
-    ws.append(['Python', 'Test', 'Is it easy?', 2, 'No', False, 2])
 
-    excel_bytes = io.BytesIO()
-    wb.save(excel_bytes)
-    excel_bytes.seek(0)
+@pytest.fixture
+def no_correct_rows():
+    """First question has no correct answer"""
+    return _rows(
+        ('Python', 'Test', 'What is it?', 1, 'Language', False, 1),
+        ('Python', 'Test', 'What is it?', 1, 'Snake', False, 2),
+        ('Python', 'Test', 'Is it easy?', 2, 'Yes', True, 1),
+        ('Python', 'Test', 'Is it easy?', 2, 'No', False, 2),
+    )
 
-    return excel_bytes.read()
+
+@pytest.fixture
+def too_many_answers_rows():
+    """First question has 5 answers (maximum is 4)"""
+    return _rows(
+        ('Python', 'Test', 'What is it?', 1, 'Answer 1', True, 1),
+        ('Python', 'Test', 'What is it?', 1, 'Answer 2', False, 2),
+        ('Python', 'Test', 'What is it?', 1, 'Answer 3', False, 3),
+        ('Python', 'Test', 'What is it?', 1, 'Answer 4', False, 4),
+        ('Python', 'Test', 'What is it?', 1, 'Answer 5', False, 5),
+        ('Python', 'Test', 'Is it easy?', 2, 'Yes', True, 1),
+        ('Python', 'Test', 'Is it easy?', 2, 'No', False, 2),
+    )
 
 
 class TestExcelParsing:
     """Test Excel file parsing (unit tests without DB)"""
 
-    def test_parse_valid_excel(self, valid_excel_bytes):
+    def test_parse_valid_excel(self, excel_service, valid_excel_bytes):
         """Test parsing valid Excel file"""
-        class MockDB:
-            pass
-
-        service = ExcelImportService(MockDB())
-
-        rows = service._parse_excel(valid_excel_bytes)
+        rows = excel_service._parse_excel(valid_excel_bytes)
 
         assert len(rows) == 4
         assert rows[0]['quiz_title'] == 'Python Basics'
@@ -102,37 +119,26 @@ class TestExcelParsing:
         assert rows[0]['answer_text'] == 'A programming language'
         assert rows[0]['is_correct'] is True
 
-    def test_parse_missing_required_columns(self, invalid_excel_missing_columns):
+    def test_parse_missing_required_columns(self, excel_service, invalid_excel_missing_columns):
         """Test parsing Excel with missing required columns"""
-        class MockDB:
-            pass
-
-        service = ExcelImportService(MockDB())
-
         with pytest.raises(Exception) as exc_info:
-            service._parse_excel(invalid_excel_missing_columns)
+            excel_service._parse_excel(invalid_excel_missing_columns)
 
         assert "Missing required column: answer_text" in str(exc_info.value)
 
-    def test_parse_empty_file(self):
+    def test_parse_empty_file(self, excel_service):
         """Test parsing empty Excel file"""
         wb = Workbook()
         ws = wb.active
 
-        ws.append(['quiz_title', 'quiz_description', 'question_text', 'question_order',
-                   'answer_text', 'is_correct', 'answer_order'])
+        ws.append(COLUMNS)
 
         excel_bytes = io.BytesIO()
         wb.save(excel_bytes)
         excel_bytes.seek(0)
 
-        class MockDB:
-            pass
-
-        service = ExcelImportService(MockDB())
-
         with pytest.raises(Exception) as exc_info:
-            service._parse_excel(excel_bytes.read())
+            excel_service._parse_excel(excel_bytes.read())
 
         assert "Excel file is empty" in str(exc_info.value)
 
@@ -140,69 +146,28 @@ class TestExcelParsing:
 class TestExcelValidation:
     """Test Excel data validation (unit tests without DB)"""
 
-    def test_validate_valid_data(self, valid_excel_bytes):
+    def test_validate_valid_data(self, excel_service, valid_rows):
         """Test validation passes with valid data"""
-        class MockDB:
-            pass
-
-        service = ExcelImportService(MockDB())
-        rows = service._parse_excel(valid_excel_bytes)
-
-        service._validate_quiz_data(rows)
+        excel_service._validate_quiz_data(valid_rows)
 
-    def test_validate_too_few_questions(self, invalid_excel_too_few_questions):
+    def test_validate_too_few_questions(self, excel_service, too_few_rows):
         """Test validation fails with less than 2 questions"""
-        class MockDB:
-            pass
-
-        service = ExcelImportService(MockDB())
-        rows = service._parse_excel(invalid_excel_too_few_questions)
-
         with pytest.raises(Exception) as exc_info:
-            service._validate_quiz_data(rows)
+            excel_service._validate_quiz_data(too_few_rows)
 
         assert "must have at least 2 questions" in str(exc_info.value)
 
-    def test_validate_no_correct_answer(self, invalid_excel_no_correct_answer):
+    def test_validate_no_correct_answer(self, excel_service, no_correct_rows):
         """Test validation fails when question has no correct answer"""
-        class MockDB:
-            pass
-
-        service = ExcelImportService(MockDB())
-        rows = service._parse_excel(invalid_excel_no_correct_answer)
-
         with pytest.raises(Exception) as exc_info:
-            service._validate_quiz_data(rows)
+            excel_service._validate_quiz_data(no_correct_rows)
 
         assert "must have at least one correct answer" in str(exc_info.value)
 
-    def test_validate_too_many_answers(self):
+    def test_validate_too_many_answers(self, excel_service, too_many_answers_rows):
         """Test validation fails when question has more than 4 answers"""
-        wb = Workbook()
-        ws = wb.active
-
-        ws.append(['quiz_title', 'quiz_description', 'question_text', 'question_order',
-                   'answer_text', 'is_correct', 'answer_order'])
-        ws.append(['Python', 'Test', 'What is it?', 1, 'Answer 1', True, 1])
-        ws.append(['Python', 'Test', 'What is it?', 1, 'Answer 2', False, 2])
-        ws.append(['Python', 'Test', 'What is it?', 1, 'Answer 3', False, 3])
-        ws.append(['Python', 'Test', 'What is it?', 1, 'Answer 4', False, 4])
-        ws.append(['Python', 'Test', 'What is it?', 1, 'Answer 5', False, 5])
-        ws.append(['Python', 'Test', 'Is it easy?', 2, 'Yes', True, 1])
-        ws.append(['Python', 'Test', 'Is it easy?', 2, 'No', False, 2])
-
-        excel_bytes = io.BytesIO()
-        wb.save(excel_bytes)
-        excel_bytes.seek(0)
-
-        class MockDB:
-            pass
-
-        service = ExcelImportService(MockDB())
-        rows = service._parse_excel(excel_bytes.read())
-
         with pytest.raises(Exception) as exc_info:
-            service._validate_quiz_data(rows)
+            excel_service._validate_quiz_data(too_many_answers_rows)
 
         assert "must have 2-4 answers" in str(exc_info.value)
 
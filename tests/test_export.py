@@ -1,14 +1,23 @@
+import pytest
+
 from app.services.export_service import ExportService
 
 
-def test_export_service_has_required_methods():
-    """Test that ExportService has all required methods"""
-    assert hasattr(ExportService, 'export_user_responses')
-    assert hasattr(ExportService, 'export_company_user_responses')
-    assert hasattr(ExportService, 'export_quiz_responses')
-    assert hasattr(ExportService, '_check_owner_or_admin')
-    assert hasattr(ExportService, '_response_to_json')
-    assert hasattr(ExportService, '_response_to_csv')
+@pytest.fixture(scope="module")
+def sample_csv():
+    """CSV for one exported response, converted once for the module"""
+    responses = [
+        {
+            "user_id": "user-1",
+            "company_id": "company-1",
+            "quiz_id": "quiz-1",
+            "question_id": "question-1",
+            "answer_ids": ["answer-1", "answer-2"],
+            "is_correct": True,
+            "answered_at": "2024-01-15T10:30:00Z"
+        }
+    ]
+    return ExportService._response_to_csv(responses)
 
 
 def test_json_conversion():
@@ -30,27 +39,12 @@ def test_json_conversion():
     assert parsed[0]["is_correct"] is True
 
 
-def test_csv_conversion():
+def test_csv_conversion(sample_csv):
     """Test CSV conversion from responses"""
-    responses = [
-        {
-            "user_id": "user-1",
-            "company_id": "company-1",
-            "quiz_id": "quiz-1",
-            "question_id": "question-1",
-            "answer_ids": ["answer-1", "answer-2"],
-            "is_correct": True,
-            "answered_at": "2024-01-15T10:30:00Z"
-        }
-    ]
-
-    result = ExportService._response_to_csv(responses)
-
-    lines = result.strip().split('\n')
-    assert len(lines) == 2
-    assert "user_id" in lines[0]
-    assert "is_correct" in lines[0]
-    assert "user-1" in lines[1]
+    assert sample_csv.count("\n") == 2
+    assert "user_id" in sample_csv
+    assert "is_correct" in sample_csv
+    assert "user-1" in sample_csv
 
 
 def test_csv_empty_responses():
@@ -59,23 +53,6 @@ def test_csv_empty_responses():
     assert result == ""
 
 
-def test_csv_answer_ids_formatting():
+def test_csv_answer_ids_formatting(sample_csv):
     """Test that answer_ids are properly formatted as JSON array in CSV"""
-    import json
-
-    responses = [
-        {
-            "user_id": "user-1",
-            "company_id": "company-1",
-            "quiz_id": "quiz-1",
-            "question_id": "question-1",
-            "answer_ids": ["answer-1", "answer-2"],
-            "is_correct": True,
-            "answered_at": "2024-01-15T10:30:00Z"
-        }
-    ]
-
-    result = ExportService._response_to_csv(responses)
-    lines = result.strip().split('\n')
-
-    assert '"answer-1"' in lines[1] or "'answer-1'" in lines[1]
+    assert '"answer-1"' in sample_csv or "'answer-1'" in sample_csv
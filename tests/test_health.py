@@ -1,10 +1,22 @@
+import pytest
 from fastapi.testclient import TestClient
-from app.main import app
 
-client = TestClient(app)
 
+@pytest.fixture(scope="session")
+def fastapi_app():
+    """Import the app only when a health test actually runs"""
+    from app.main import app
+    return app
 
-def test_health_check():
+
+@pytest.fixture(scope="session")
+def client(fastapi_app):
+    """Shared client; not entered as a context manager so lifespan (Redis, scheduler) is not started"""
+    return TestClient(fastapi_app)
+
+
+@pytest.mark.smoke
+def test_health_check(client):
     """Test health check endpoint"""
     response = client.get("/")
 
@@ -16,7 +28,8 @@ def test_health_check():
     assert json_response["result"] == "working"
 
 
-def test_health_check_response_structure():
+@pytest.mark.smoke
+def test_health_check_response_structure(client):
     """Test health check response has correct structure"""
     response = client.get("/")
     json_response = response.json()
@@ -1,4 +1,3 @@
-from app.services.notification_service import NotificationService
 from app.schemas.notification import (
     NotificationBase,
     NotificationCreate,
@@ -8,44 +7,22 @@ from app.schemas.notification import (
 )
 
 
-def test_notification_service_has_required_methods():
-    """Test that NotificationService has all required methods"""
-    assert hasattr(NotificationService, 'get_user_notifications')
-    assert hasattr(NotificationService, 'get_unread_count')
-    assert hasattr(NotificationService, 'mark_notification_as_read')
-    assert hasattr(NotificationService, 'mark_all_as_read')
-    assert hasattr(NotificationService, 'notify_quiz_created')
-
-
 def test_notification_schemas():
     """Test that notification schemas have required fields"""
-    # NotificationBase
-    assert 'message' in NotificationBase.model_fields
-    assert 'notification_type' in NotificationBase.model_fields
-
-    # NotificationCreate
-    assert 'user_id' in NotificationCreate.model_fields
-    assert 'related_entity_id' in NotificationCreate.model_fields
-    assert 'message' in NotificationCreate.model_fields
-    assert 'notification_type' in NotificationCreate.model_fields
-
-    # NotificationResponse
-    assert 'id' in NotificationResponse.model_fields
-    assert 'user_id' in NotificationResponse.model_fields
-    assert 'message' in NotificationResponse.model_fields
-    assert 'notification_type' in NotificationResponse.model_fields
-    assert 'is_read' in NotificationResponse.model_fields
-    assert 'read_at' in NotificationResponse.model_fields
-    assert 'created_at' in NotificationResponse.model_fields
-    assert 'updated_at' in NotificationResponse.model_fields
-
-    # NotificationList
-    assert 'notifications' in NotificationList.model_fields
-    assert 'total' in NotificationList.model_fields
-    assert 'total_count' in NotificationList.model_fields
-
-    # UnreadCountResponse
-    assert 'unread_count' in UnreadCountResponse.model_fields
+    expected_fields = [
+        (NotificationBase, {'message', 'notification_type'}),
+        (NotificationCreate, {'user_id', 'related_entity_id', 'message', 'notification_type'}),
+        (
+            NotificationResponse,
+            {'id', 'user_id', 'message', 'notification_type', 'is_read', 'read_at', 'created_at', 'updated_at'},
+        ),
+        (NotificationList, {'notifications', 'total', 'total_count'}),
+        (UnreadCountResponse, {'unread_count'}),
+    ]
+
+    for schema, expected in expected_fields:
+        missing = expected - schema.model_fields.keys()
+        assert not missing, f"{schema.__name__} is missing {missing}"
 
 
 def test_notification_create_schema():
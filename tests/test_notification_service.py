@@ -1,345 +1,148 @@
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
-from uuid import uuid4
-from datetime import datetime, timezone
+from unittest.mock import AsyncMock
 from fastapi import HTTPException
+from app.core.websocket import manager
 from app.services.notification_service import NotificationService
 from app.repositories.notification import NotificationRepository
 from app.repositories.company_member import CompanyMemberRepository
-from app.models.user import User
-from app.models.notification import Notification
-from app.models.company_member import CompanyMember
+from tests.factories import fake_member, fake_notification, fake_user, next_uuid
+from tests.helpers import assert_http
+
+QUIZ_CREATED_MESSAGE = "New quiz 'Test Quiz' has been created in Test Company. Take it now!"
+
+
+def _quiz_notification(user_id, quiz_id):
+    """Notification as returned by create_bulk_notifications for a new quiz"""
+    return fake_notification(user_id=user_id, message=QUIZ_CREATED_MESSAGE, related_entity_id=quiz_id)
+
+
+@pytest.fixture
+def service(mock_session):
+    return NotificationService(mock_session)
+
+
+@pytest.fixture
+def mock_user():
+    return fake_user()
 
 
-@pytest.mark.asyncio
 class TestNotificationService:
     """Tests for NotificationService"""
 
-    async def test_get_user_notifications_success(self):
+    async def test_get_user_notifications_success(self, service, mock_user, patch_repo):
         """Test getting user notifications returns list"""
-        mock_session = AsyncMock()
-        user_id = uuid4()
-
-        mock_user = User(
-            id=user_id,
-            email="user@test.com",
-            username="user",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        user_id = mock_user.id
 
-        mock_notifications = [
-            Notification(
-                id=uuid4(),
-                user_id=user_id,
-                message="Test notification",
-                notification_type="quiz_created",
-                is_read=False,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
-            )
-        ]
+        mock_notifications = [fake_notification(user_id=user_id)]
 
-        with patch.object(NotificationRepository, 'get_user_notifications',
-                          new_callable=AsyncMock) as mock_get_notifications:
-            with patch.object(NotificationRepository, 'count', new_callable=AsyncMock) as mock_count:
-                with patch.object(NotificationRepository, 'get_unread_count',
-                                  new_callable=AsyncMock) as mock_unread_count:
-                    mock_get_notifications.return_value = mock_notifications
-                    mock_count.return_value = 1
-                    mock_unread_count.return_value = 1
+        patch_repo(
+            NotificationRepository,
+            get_user_notifications=mock_notifications,
+            count=1,
+            get_unread_count=1,
+        )
 
-                    service = NotificationService(mock_session)
-                    result = await service.get_user_notifications(mock_user, skip=0, limit=50)
+        result = await service.get_user_notifications(mock_user, skip=0, limit=50)
 
-                    assert result.total == 1
-                    assert result.total_count == 1
-                    assert len(result.notifications) == 1
+        assert (result.total, result.total_count, len(result.notifications)) == (1, 1, 1)
 
-    async def test_get_unread_count_success(self):
+    async def test_get_unread_count_success(self, service, mock_user, patch_repo):
         """Test getting unread count"""
-        mock_session = AsyncMock()
-        user_id = uuid4()
-
-        mock_user = User(
-            id=user_id,
-            email="user@test.com",
-            username="user",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        patch_repo(NotificationRepository, get_unread_count=5)
 
-        with patch.object(NotificationRepository, 'get_unread_count', new_callable=AsyncMock) as mock_unread_count:
-            mock_unread_count.return_value = 5
+        result = await service.get_unread_count(mock_user)
 
-            service = NotificationService(mock_session)
-            result = await service.get_unread_count(mock_user)
+        assert result.unread_count == 5
 
-            assert result.unread_count == 5
-
-    async def test_mark_notification_as_read_success(self):
+    async def test_mark_notification_as_read_success(self, service, mock_user, patch_repo):
         """Test successfully marking notification as read"""
-        mock_session = AsyncMock()
-        user_id = uuid4()
-        notification_id = uuid4()
-
-        mock_user = User(
-            id=user_id,
-            email="user@test.com",
-            username="user",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        user_id = mock_user.id
+        notification_id = next_uuid()
 
-        mock_notification = Notification(
-            id=notification_id,
-            user_id=user_id,
-            message="Test notification",
-            notification_type="quiz_created",
-            is_read=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        mock_notification = fake_notification(id=notification_id, user_id=user_id, is_read=True)
 
-        with patch.object(NotificationRepository, 'mark_as_read', new_callable=AsyncMock) as mock_mark_as_read:
-            mock_mark_as_read.return_value = mock_notification
+        patch_repo(NotificationRepository, mark_as_read=mock_notification)
 
-            service = NotificationService(mock_session)
-            result = await service.mark_notification_as_read(notification_id, mock_user)
+        result = await service.mark_notification_as_read(notification_id, mock_user)
 
-            assert result.id == notification_id
-            assert result.is_read == True
+        assert (result.id, result.is_read) == (notification_id, True)
 
-    async def test_mark_notification_as_read_not_found(self):
+    async def test_mark_notification_as_read_not_found(self, service, mock_user, patch_repo):
         """Test mark as read fails when notification doesn't exist"""
-        mock_session = AsyncMock()
-        user_id = uuid4()
-        notification_id = uuid4()
-
-        mock_user = User(
-            id=user_id,
-            email="user@test.com",
-            username="user",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        with patch.object(NotificationRepository, 'mark_as_read', new_callable=AsyncMock) as mock_mark_as_read:
-            mock_mark_as_read.return_value = None
+        notification_id = next_uuid()
 
-            service = NotificationService(mock_session)
+        patch_repo(NotificationRepository, mark_as_read=None)
 
-            with pytest.raises(HTTPException) as exc_info:
-                await service.mark_notification_as_read(notification_id, mock_user)
+        with pytest.raises(HTTPException) as exc_info:
+            await service.mark_notification_as_read(notification_id, mock_user)
 
-            assert exc_info.value.status_code == 404
-            assert exc_info.value.detail == "Notification not found"
+        assert_http(exc_info, 404, "Notification not found")
 
-    async def test_mark_all_as_read_success(self):
+    async def test_mark_all_as_read_success(self, service, mock_user, patch_repo):
         """Test successfully marking all notifications as read"""
-        mock_session = AsyncMock()
-        user_id = uuid4()
-
-        mock_user = User(
-            id=user_id,
-            email="user@test.com",
-            username="user",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        with patch.object(NotificationRepository, 'mark_all_as_read', new_callable=AsyncMock) as mock_mark_all:
-            mock_mark_all.return_value = 3
+        patch_repo(NotificationRepository, mark_all_as_read=3)
 
-            service = NotificationService(mock_session)
-            result = await service.mark_all_as_read(mock_user)
+        result = await service.mark_all_as_read(mock_user)
 
-            assert result["updated_count"] == 3
-            assert result["message"] == "All notifications marked as read"
+        assert result == {"message": "All notifications marked as read", "updated_count": 3}
 
-    async def test_notify_quiz_created_success(self):
-        """Test successfully creating notifications for quiz"""
-        mock_session = AsyncMock()
-        quiz_id = uuid4()
-        company_id = uuid4()
-        creator_id = uuid4()
-        member1_id = uuid4()
-        member2_id = uuid4()
+    @pytest.mark.parametrize("creator_is_admin, other_admin_flags", [
+        (False, [False, True]),
+        (True, [False]),
+    ], ids=["notifies_every_other_member", "skips_admin_creator"])
+    async def test_notify_quiz_created(
+            self, service, patch_repo, monkeypatch, creator_is_admin, other_admin_flags
+    ):
+        """Test notifications go to every member except the quiz creator"""
+        quiz_id = next_uuid()
+        company_id = next_uuid()
+        creator_id = next_uuid()
+        other_ids = [next_uuid() for _ in other_admin_flags]
 
         mock_members = [
-            CompanyMember(
-                id=uuid4(),
-                user_id=creator_id,
-                company_id=company_id,
-                is_admin=False,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
-            ),
-            CompanyMember(
-                id=uuid4(),
-                user_id=member1_id,
-                company_id=company_id,
-                is_admin=False,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
-            ),
-            CompanyMember(
-                id=uuid4(),
-                user_id=member2_id,
-                company_id=company_id,
-                is_admin=True,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
-            )
+            fake_member(user_id=creator_id, company_id=company_id, is_admin=creator_is_admin),
+            *[
+                fake_member(user_id=user_id, company_id=company_id, is_admin=is_admin)
+                for user_id, is_admin in zip(other_ids, other_admin_flags)
+            ],
         ]
 
-        notification1 = Notification(
-            id=uuid4(),
-            user_id=member1_id,
-            message="New quiz 'Test Quiz' has been created in Test Company. Take it now!",
-            notification_type="quiz_created",
-            is_read=False,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-        notification1.related_entity_id = quiz_id
-
-        notification2 = Notification(
-            id=uuid4(),
-            user_id=member2_id,
-            message="New quiz 'Test Quiz' has been created in Test Company. Take it now!",
-            notification_type="quiz_created",
-            is_read=False,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-        notification2.related_entity_id = quiz_id
-
-        created_notifications = [notification1, notification2]
-
-        with patch.object(CompanyMemberRepository, 'get_company_members', new_callable=AsyncMock) as mock_get_members:
-            with patch.object(NotificationRepository, 'create_bulk_notifications',
-                              new_callable=AsyncMock) as mock_create_bulk:
-                with patch('app.core.websocket.manager') as mock_manager:
-                    mock_get_members.return_value = mock_members
-                    mock_create_bulk.return_value = created_notifications
-                    mock_manager.send_personal_notification = AsyncMock()
-
-                    service = NotificationService(mock_session)
-                    result = await service.notify_quiz_created(
-                        quiz_id=quiz_id,
-                        quiz_title="Test Quiz",
-                        company_id=company_id,
-                        company_name="Test Company",
-                        creator_id=creator_id
-                    )
-
-                    assert result == 2
-                    mock_create_bulk.assert_called_once()
-                    assert mock_manager.send_personal_notification.call_count == 2
-
-    async def test_notify_quiz_created_no_members(self):
-        """Test notify returns 0 when no members to notify"""
-        mock_session = AsyncMock()
-        quiz_id = uuid4()
-        company_id = uuid4()
-        creator_id = uuid4()
-
-        mock_members = [
-            CompanyMember(
-                id=uuid4(),
-                user_id=creator_id,
-                company_id=company_id,
-                is_admin=False,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
-            )
-        ]
+        created_notifications = [_quiz_notification(user_id, quiz_id) for user_id in other_ids]
 
-        with patch.object(CompanyMemberRepository, 'get_company_members', new_callable=AsyncMock) as mock_get_members:
-            mock_get_members.return_value = mock_members
+        patch_repo(CompanyMemberRepository, get_company_members=mock_members)
+        notification_repo = patch_repo(NotificationRepository, create_bulk_notifications=created_notifications)
+        send_notification = AsyncMock()
+        monkeypatch.setattr(manager, "send_personal_notification", send_notification)
 
-            service = NotificationService(mock_session)
-            result = await service.notify_quiz_created(
-                quiz_id=quiz_id,
-                quiz_title="Test Quiz",
-                company_id=company_id,
-                company_name="Test Company",
-                creator_id=creator_id
-            )
+        result = await service.notify_quiz_created(
+            quiz_id=quiz_id,
+            quiz_title="Test Quiz",
+            company_id=company_id,
+            company_name="Test Company",
+            creator_id=creator_id
+        )
 
-            assert result == 0
+        assert (result, send_notification.call_count) == (len(other_ids), len(other_ids))
+        notification_repo.create_bulk_notifications.assert_called_once()
 
-    async def test_notify_quiz_created_skips_creator(self):
-        """Test notify skips the creator"""
-        mock_session = AsyncMock()
-        quiz_id = uuid4()
-        company_id = uuid4()
-        creator_id = uuid4()
-        member_id = uuid4()
+    async def test_notify_quiz_created_no_members(self, service, patch_repo):
+        """Test notify returns 0 when no members to notify"""
+        quiz_id = next_uuid()
+        company_id = next_uuid()
+        creator_id = next_uuid()
 
         mock_members = [
-            CompanyMember(
-                id=uuid4(),
-                user_id=creator_id,
-                company_id=company_id,
-                is_admin=True,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
-            ),
-            CompanyMember(
-                id=uuid4(),
-                user_id=member_id,
-                company_id=company_id,
-                is_admin=False,
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
-            )
+            fake_member(user_id=creator_id, company_id=company_id)
         ]
 
-        notification = Notification(
-            id=uuid4(),
-            user_id=member_id,
-            message="New quiz 'Test Quiz' has been created in Test Company. Take it now!",
-            notification_type="quiz_created",
-            is_read=False,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
+        patch_repo(CompanyMemberRepository, get_company_members=mock_members)
+
+        result = await service.notify_quiz_created(
+            quiz_id=quiz_id,
+            quiz_title="Test Quiz",
+            company_id=company_id,
+            company_name="Test Company",
+            creator_id=creator_id
         )
-        notification.related_entity_id = quiz_id
-
-        created_notification = [notification]
-
-        with patch.object(CompanyMemberRepository, 'get_company_members', new_callable=AsyncMock) as mock_get_members:
-            with patch.object(NotificationRepository, 'create_bulk_notifications',
-                              new_callable=AsyncMock) as mock_create_bulk:
-                with patch('app.core.websocket.manager') as mock_manager:
-                    mock_get_members.return_value = mock_members
-                    mock_create_bulk.return_value = created_notification
-                    mock_manager.send_personal_notification = AsyncMock()
-
-                    service = NotificationService(mock_session)
-                    result = await service.notify_quiz_created(
-                        quiz_id=quiz_id,
-                        quiz_title="Test Quiz",
-                        company_id=company_id,
-                        company_name="Test Company",
-                        creator_id=creator_id
-                    )
-
-                    assert result == 1
+
+        assert result == 0
@@ -1,36 +1,3 @@
-from app.services.quiz_service import QuizService
-from app.repositories.quiz import QuizRepository
-from app.repositories.question import QuestionRepository
-from app.repositories.answer import AnswerRepository
-
-
-def test_quiz_service_has_required_methods():
-    """Test that QuizService has all required methods"""
-    assert hasattr(QuizService, 'create_quiz')
-    assert hasattr(QuizService, 'update_quiz')
-    assert hasattr(QuizService, 'delete_quiz')
-    assert hasattr(QuizService, 'get_company_quizzes')
-    assert hasattr(QuizService, 'get_quiz')
-    assert hasattr(QuizService, '_check_owner_or_admin')
-
-
-def test_quiz_repository_has_required_methods():
-    """Test that QuizRepository has all required methods"""
-    assert hasattr(QuizRepository, 'get_company_quizzes')
-    assert hasattr(QuizRepository, 'count_company_quizzes')
-    assert hasattr(QuizRepository, 'get_quiz_with_questions')
-
-
-def test_question_repository_exists():
-    """Test that QuestionRepository exists"""
-    assert QuestionRepository is not None
-
-
-def test_answer_repository_exists():
-    """Test that AnswerRepository exists"""
-    assert AnswerRepository is not None
-
-
 def test_quiz_schema_validation():
     """Test that Quiz schemas have proper validation"""
     from app.schemas.quiz import QuizCreate, QuestionCreate, AnswerCreate
@@ -1,7 +1,6 @@
 import pytest
-from unittest.mock import AsyncMock, patch
-from uuid import uuid4
-from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 from fastapi import HTTPException
 
 from app.services.quiz_attempt_service import QuizAttemptService
@@ -9,574 +8,211 @@ from app.repositories.quiz import QuizRepository
 from app.repositories.company import CompanyRepository
 from app.repositories.quiz_attempt import QuizAttemptRepository
 
-from app.models.user import User
-from app.models.quiz import Quiz
-from app.models.question import Question
-from app.models.answer import Answer
-from app.models.quiz_attempt import QuizAttempt
-
 from app.schemas.quiz import QuizSubmission, AnswerSubmission
-
-
-@pytest.mark.asyncio
-class TestQuizAttemptService:
-
-    async def test_submit_quiz_all_correct_answers(self):
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        quiz_id = uuid4()
-        user_id = uuid4()
-
-        mock_user = User(
-            id=user_id,
-            email="user@test.com",
-            username="testuser",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        q1_id = uuid4()
-        q2_id = uuid4()
-        a1_id = uuid4()
-        a2_id = uuid4()
-
-        quiz = Quiz(
-            id=quiz_id,
-            company_id=company_id,
-            title="Quiz",
-            frequency=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-
-        q1 = Question(
-            id=q1_id,
+from app.services.redis_service import RedisService
+from tests.factories import (
+    NOW, fake_answer, fake_company, fake_question, fake_quiz, fake_quiz_attempt, fake_user, next_uuid
+)
+
+
+@pytest.fixture
+def mock_user():
+    return fake_user(username="testuser")
+
+
+@pytest.fixture
+def service(mock_session):
+    return QuizAttemptService(mock_session)
+
+
+@pytest.fixture(scope="class")
+def _redis_stub():
+    """RedisService.store_quiz_response, patched once per test class"""
+    stub = AsyncMock(return_value=None)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(RedisService, "store_quiz_response", stub)
+        yield stub
+
+
+@pytest.fixture
+def patched_repos(patch_repo, _redis_stub):
+    """Repository and Redis calls made by QuizAttemptService, patched with AsyncMocks returning None"""
+    quiz_repo = patch_repo(QuizRepository, get_quiz_with_questions=None, update=None)
+    attempt_repo = patch_repo(QuizAttemptRepository, create=None, get_user_company_stats=None, get_user_system_stats=None)
+    _redis_stub.reset_mock()
+    return SimpleNamespace(
+        get_quiz=quiz_repo.get_quiz_with_questions,
+        update_quiz=quiz_repo.update,
+        create_attempt=attempt_repo.create,
+        company_stats=attempt_repo.get_user_company_stats,
+        system_stats=attempt_repo.get_user_system_stats,
+        get_company=patch_repo(CompanyRepository, get_by_id=None).get_by_id,
+        store_response=_redis_stub,
+    )
+
+
+def _two_question_quiz(company_id, quiz_id):
+    """Quiz with two questions; each has a correct answer first and a wrong answer second"""
+    questions = []
+    for order in range(2):
+        question_id = next_uuid()
+        questions.append(fake_question(
+            id=question_id,
             quiz_id=quiz_id,
-            title="Q1",
-            order=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-        q1.answers = [
-            Answer(id=a1_id, question_id=q1_id, text="Correct", is_correct=True, order=0),
-            Answer(id=uuid4(), question_id=q1_id, text="Wrong", is_correct=False, order=1),
-        ]
-
-        q2 = Question(
-            id=q2_id,
-            quiz_id=quiz_id,
-            title="Q2",
-            order=1,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-        q2.answers = [
-            Answer(id=a2_id, question_id=q2_id, text="Correct", is_correct=True, order=0),
-            Answer(id=uuid4(), question_id=q2_id, text="Wrong", is_correct=False, order=1),
-        ]
-
-        quiz.questions = [q1, q2]
-
-        submission = QuizSubmission(
+            title=f"Q{order + 1}",
+            order=order,
             answers=[
-                AnswerSubmission(question_id=q1_id, answer_ids=[a1_id]),
-                AnswerSubmission(question_id=q2_id, answer_ids=[a2_id]),
-            ]
-        )
-
-        created_attempt = QuizAttempt(
-            id=uuid4(),
-            user_id=user_id,
-            quiz_id=quiz_id,
-            company_id=company_id,
-            score=2,
-            total_questions=2,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
+                fake_answer(id=next_uuid(), question_id=question_id, text="Correct", is_correct=True, order=0),
+                fake_answer(id=next_uuid(), question_id=question_id, text="Wrong", is_correct=False, order=1),
+            ],
+        ))
+    return fake_quiz(id=quiz_id, company_id=company_id, questions=questions)
 
-        with patch.object(QuizRepository, "get_quiz_with_questions", new_callable=AsyncMock) as mock_get:
-            with patch.object(QuizAttemptRepository, "create", new_callable=AsyncMock) as mock_create:
-                with patch.object(QuizRepository, "update", new_callable=AsyncMock):
-                    with patch("app.services.quiz_attempt_service.RedisService.store_quiz_response",
-                               new_callable=AsyncMock) as mock_redis:
-                        mock_get.return_value = quiz
-                        mock_create.return_value = created_attempt
-
-                        service = QuizAttemptService(mock_session)
-                        result = await service.submit_quiz(company_id, quiz_id, submission, mock_user)
-
-                        assert result.score == 2
-                        assert result.percentage == 100.0
-                        assert mock_redis.call_count == 2
-
-    async def test_submit_quiz_partial_correct_answers(self):
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        quiz_id = uuid4()
-        user_id = uuid4()
-
-        mock_user = User(
-            id=user_id,
-            email="user@test.com",
-            username="testuser",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
 
-        q1_id = uuid4()
-        q2_id = uuid4()
-        correct_id = uuid4()
-        wrong_id = uuid4()
+@pytest.fixture
+def quiz():
+    """Built per test, since submit_quiz bumps quiz.frequency"""
+    return _two_question_quiz(next_uuid(), next_uuid())
 
-        quiz = Quiz(
-            id=quiz_id,
-            company_id=company_id,
-            title="Quiz",
-            frequency=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
 
-        q1 = Question(
-            id=q1_id,
-            quiz_id=quiz_id,
-            title="Q1",
-            order=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-        q1.answers = [
-            Answer(id=correct_id, question_id=q1_id, text="Correct", is_correct=True, order=0),
-            Answer(id=uuid4(), question_id=q1_id, text="Wrong", is_correct=False, order=1),
-        ]
-
-        q2 = Question(
-            id=q2_id,
-            quiz_id=quiz_id,
-            title="Q2",
-            order=1,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
-        q2.answers = [
-            Answer(id=uuid4(), question_id=q2_id, text="Correct", is_correct=True, order=0),
-            Answer(id=wrong_id, question_id=q2_id, text="Wrong", is_correct=False, order=1),
-        ]
-
-        quiz.questions = [q1, q2]
+class TestQuizAttemptService:
 
+    @pytest.mark.parametrize("picks, expected_score, expected_percentage", [
+        (("correct", "correct"), 2, 100.0),
+        (("correct", "wrong"), 1, 50.0),
+        (("wrong", "wrong"), 0, 0.0),
+    ], ids=["all_correct", "partial_correct", "all_wrong"])
+    async def test_submit_quiz_scoring(
+            self, service, mock_user, patched_repos, quiz, picks, expected_score, expected_percentage
+    ):
+        """Test score and percentage for all correct, partially correct and all wrong submissions"""
+        company_id = quiz.company_id
+        quiz_id = quiz.id
+
+        answer_index = {"correct": 0, "wrong": 1}
         submission = QuizSubmission(
             answers=[
-                AnswerSubmission(question_id=q1_id, answer_ids=[correct_id]),
-                AnswerSubmission(question_id=q2_id, answer_ids=[wrong_id]),
+                AnswerSubmission(question_id=question.id, answer_ids=[question.answers[answer_index[pick]].id])
+                for question, pick in zip(quiz.questions, picks)
             ]
         )
 
-        created_attempt = QuizAttempt(
-            id=uuid4(),
-            user_id=user_id,
+        created_attempt = fake_quiz_attempt(
+            user_id=mock_user.id,
             quiz_id=quiz_id,
             company_id=company_id,
-            score=1,
+            score=expected_score,
             total_questions=2,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
         )
 
-        with patch.object(QuizRepository, "get_quiz_with_questions", new_callable=AsyncMock) as mock_get:
-            with patch.object(QuizAttemptRepository, "create", new_callable=AsyncMock) as mock_create:
-                with patch("app.services.quiz_attempt_service.RedisService.store_quiz_response",
-                           new_callable=AsyncMock):
-                    mock_get.return_value = quiz
-                    mock_create.return_value = created_attempt
-
-                    service = QuizAttemptService(mock_session)
-                    result = await service.submit_quiz(company_id, quiz_id, submission, mock_user)
-
-                    assert result.score == 1
-                    assert result.percentage == 50.0
-
-    async def test_submit_quiz_not_found(self):
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        quiz_id = uuid4()
-
-        user = User(
-            id=uuid4(),
-            email="user@test.com",
-            username="testuser",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
-        )
+        patched_repos.get_quiz.return_value = quiz
+        patched_repos.create_attempt.return_value = created_attempt
 
-        submission = QuizSubmission(answers=[
-            AnswerSubmission(question_id=uuid4(), answer_ids=[uuid4()])
-        ])
-
-        with patch.object(QuizRepository, "get_quiz_with_questions", new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = None
-
-            service = QuizAttemptService(mock_session)
-
-            with pytest.raises(HTTPException) as exc:
-                await service.submit_quiz(company_id, quiz_id, submission, user)
-
-            assert exc.value.status_code == 404
-            assert exc.value.detail == "Quiz not found"
-
-    async def test_submit_quiz_all_wrong_answers(self):
-        """Test submitting quiz with all wrong answers"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        quiz_id = uuid4()
-        user_id = uuid4()
-
-        mock_user = User(
-            id=user_id,
-            email="user@test.com",
-            username="testuser",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        q1_id = uuid4()
-        wrong1_id = uuid4()
-
-        quiz = Quiz(
-            id=quiz_id,
-            company_id=company_id,
-            title="Test Quiz",
-            frequency=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        q1 = Question(
-            id=q1_id,
-            quiz_id=quiz_id,
-            title="Question 1",
-            order=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-        q1.answers = [
-            Answer(id=uuid4(), question_id=q1_id, text="Correct", is_correct=True, order=0),
-            Answer(id=wrong1_id, question_id=q1_id, text="Wrong", is_correct=False, order=1)
-        ]
-
-        q2_id = uuid4()
-        wrong2_id = uuid4()
-
-        q2 = Question(
-            id=q2_id,
-            quiz_id=quiz_id,
-            title="Question 2",
-            order=1,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-        q2.answers = [
-            Answer(id=uuid4(), question_id=q2_id, text="Correct", is_correct=True, order=0),
-            Answer(id=wrong2_id, question_id=q2_id, text="Wrong", is_correct=False, order=1)
-        ]
+        result = await service.submit_quiz(company_id, quiz_id, submission, mock_user)
 
-        quiz.questions = [q1, q2]
+        assert result.score == expected_score
+        assert result.percentage == expected_percentage
+        assert patched_repos.store_response.call_count == 2
 
-        submission = QuizSubmission(
-            answers=[
-                AnswerSubmission(question_id=q1_id, answer_ids=[wrong1_id]),
-                AnswerSubmission(question_id=q2_id, answer_ids=[wrong2_id])
-            ]
-        )
+    async def test_submit_quiz_not_found(self, service, mock_user, patched_repos):
+        company_id = next_uuid()
+        quiz_id = next_uuid()
 
-        created_attempt = QuizAttempt(
-            id=uuid4(),
-            user_id=user_id,
-            quiz_id=quiz_id,
-            company_id=company_id,
-            score=0,
-            total_questions=2,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        submission = QuizSubmission(answers=[
+            AnswerSubmission(question_id=next_uuid(), answer_ids=[next_uuid()])
+        ])
 
-        with patch.object(QuizRepository, 'get_quiz_with_questions', new_callable=AsyncMock) as mock_get:
-            with patch.object(QuizAttemptRepository, 'create', new_callable=AsyncMock) as mock_create:
-                with patch.object(QuizRepository, 'update', new_callable=AsyncMock):
-                    with patch('app.services.quiz_attempt_service.RedisService.store_quiz_response',
-                               new_callable=AsyncMock):
-                        mock_get.return_value = quiz
-                        mock_create.return_value = created_attempt
+        patched_repos.get_quiz.return_value = None
 
-                        service = QuizAttemptService(mock_session)
-                        result = await service.submit_quiz(company_id, quiz_id, submission, mock_user)
+        with pytest.raises(HTTPException) as exc:
+            await service.submit_quiz(company_id, quiz_id, submission, mock_user)
 
-                        assert result.score == 0
-                        assert result.percentage == 0.0
+        assert exc.value.status_code == 404
+        assert exc.value.detail == "Quiz not found"
 
-    async def test_submit_quiz_missing_answers(self):
+    async def test_submit_quiz_missing_answers(self, service, mock_user, patched_repos, quiz):
         """Test submit fails when not all questions are answered"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        quiz_id = uuid4()
-
-        mock_user = User(
-            id=uuid4(),
-            email="user@test.com",
-            username="testuser",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        q1_id = uuid4()
-        q2_id = uuid4()
-
-        quiz = Quiz(
-            id=quiz_id,
-            company_id=company_id,
-            title="Test Quiz",
-            frequency=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        q1 = Question(
-            id=q1_id,
-            quiz_id=quiz_id,
-            title="Question 1",
-            order=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-        q1.answers = []
-
-        q2 = Question(
-            id=q2_id,
-            quiz_id=quiz_id,
-            title="Question 2",
-            order=1,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-        q2.answers = []
-
-        quiz.questions = [q1, q2]
+        company_id = quiz.company_id
+        quiz_id = quiz.id
 
         submission = QuizSubmission(
             answers=[
-                AnswerSubmission(question_id=q1_id, answer_ids=[uuid4()])
+                AnswerSubmission(question_id=quiz.questions[0].id, answer_ids=[next_uuid()])
             ]
         )
 
-        with patch.object(QuizRepository, 'get_quiz_with_questions', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = quiz
-
-            service = QuizAttemptService(mock_session)
-
-            with pytest.raises(HTTPException) as exc:
-                await service.submit_quiz(company_id, quiz_id, submission, mock_user)
-
-            assert exc.value.status_code == 400
-            assert exc.value.detail == "Must answer all questions"
-
-    async def test_get_user_company_stats_success(self):
-        """Test getting user stats for specific company"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        user_id = uuid4()
-
-        mock_user = User(
-            id=user_id,
-            email="user@test.com",
-            username="testuser",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        from app.models.company import Company
+        patched_repos.get_quiz.return_value = quiz
 
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=uuid4(),
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        with pytest.raises(HTTPException) as exc:
+            await service.submit_quiz(company_id, quiz_id, submission, mock_user)
 
-        stats_data = {
-            "total_attempts": 10,
-            "total_questions": 100,
-            "total_correct": 80,
-            "last_attempt": datetime.now(timezone.utc)
-        }
-
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(QuizAttemptRepository, 'get_user_company_stats',
-                              new_callable=AsyncMock) as mock_get_stats:
-                mock_get_company.return_value = mock_company
-                mock_get_stats.return_value = stats_data
-
-                service = QuizAttemptService(mock_session)
-                result = await service.get_user_company_stats(company_id, mock_user)
-
-                assert result.company_id == company_id
-                assert result.company_name == "Test Company"
-                assert result.stats.total_attempts == 10
-                assert result.stats.average_score == 80.0
-
-    async def test_get_user_company_stats_zero_division(self):
-        """Test stats with zero attempts (no division by zero)"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-
-        mock_user = User(
-            id=uuid4(),
-            email="user@test.com",
-            username="testuser",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        assert exc.value.status_code == 400
+        assert exc.value.detail == "Must answer all questions"
 
-        from app.models.company import Company
+    @pytest.mark.parametrize("total_attempts, total_questions, total_correct, last_attempt, expected_average", [
+        (10, 100, 80, NOW, 80.0),
+        (0, 0, 0, None, 0.0),
+    ], ids=["with_attempts", "zero_division"])
+    async def test_get_user_company_stats(
+            self, service, mock_user, patched_repos,
+            total_attempts, total_questions, total_correct, last_attempt, expected_average
+    ):
+        """Test user stats for a company, including zero attempts (no division by zero)"""
+        company_id = next_uuid()
 
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=uuid4(),
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        mock_company = fake_company(id=company_id, name="Test Company")
 
         stats_data = {
-            "total_attempts": 0,
-            "total_questions": 0,
-            "total_correct": 0,
-            "last_attempt": None
+            "total_attempts": total_attempts,
+            "total_questions": total_questions,
+            "total_correct": total_correct,
+            "last_attempt": last_attempt
         }
 
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(QuizAttemptRepository, 'get_user_company_stats',
-                              new_callable=AsyncMock) as mock_get_stats:
-                mock_get_company.return_value = mock_company
-                mock_get_stats.return_value = stats_data
+        patched_repos.get_company.return_value = mock_company
+        patched_repos.company_stats.return_value = stats_data
 
-                service = QuizAttemptService(mock_session)
-                result = await service.get_user_company_stats(company_id, mock_user)
+        result = await service.get_user_company_stats(company_id, mock_user)
 
-                assert result.stats.average_score == 0.0
+        assert result.company_id == company_id
+        assert result.company_name == "Test Company"
+        assert result.stats.total_attempts == total_attempts
+        assert result.stats.average_score == expected_average
 
-    async def test_get_user_company_stats_company_not_found(self):
+    async def test_get_user_company_stats_company_not_found(self, service, mock_user, patched_repos):
         """Test stats fails when company doesn't exist"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-
-        mock_user = User(
-            id=uuid4(),
-            email="user@test.com",
-            username="testuser",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            mock_get_company.return_value = None
-
-            service = QuizAttemptService(mock_session)
-
-            with pytest.raises(HTTPException) as exc:
-                await service.get_user_company_stats(company_id, mock_user)
-
-            assert exc.value.status_code == 404
-            assert exc.value.detail == "Company not found"
-
-    async def test_get_user_system_stats_success(self):
-        """Test getting user stats across all companies"""
-        mock_session = AsyncMock()
-
-        mock_user = User(
-            id=uuid4(),
-            email="user@test.com",
-            username="testuser",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        stats_data = {
-            "total_attempts": 50,
-            "total_questions": 500,
-            "total_correct": 400,
-            "last_attempt": datetime.now(timezone.utc),
-            "companies_count": 5
-        }
-
-        with patch.object(QuizAttemptRepository, 'get_user_system_stats', new_callable=AsyncMock) as mock_get_stats:
-            mock_get_stats.return_value = stats_data
-
-            service = QuizAttemptService(mock_session)
-            result = await service.get_user_system_stats(mock_user)
-
-            assert result.stats.total_attempts == 50
-            assert result.stats.average_score == 80.0
-            assert result.companies_participated == 5
-
-    async def test_get_user_system_stats_zero_division(self):
-        """Test system stats with zero attempts"""
-        mock_session = AsyncMock()
-
-        mock_user = User(
-            id=uuid4(),
-            email="user@test.com",
-            username="testuser",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
+        company_id = next_uuid()
+
+        patched_repos.get_company.return_value = None
+
+        with pytest.raises(HTTPException) as exc:
+            await service.get_user_company_stats(company_id, mock_user)
+
+        assert exc.value.status_code == 404
+        assert exc.value.detail == "Company not found"
+
+    @pytest.mark.parametrize(
+        "total_attempts, total_questions, total_correct, last_attempt, companies_count, expected_average", [
+            (50, 500, 400, NOW, 5, 80.0),
+            (0, 0, 0, None, 0, 0.0),
+        ], ids=["with_attempts", "zero_division"])
+    async def test_get_user_system_stats(
+            self, service, mock_user, patched_repos,
+            total_attempts, total_questions, total_correct, last_attempt, companies_count, expected_average
+    ):
+        """Test user stats across all companies, including zero attempts"""
         stats_data = {
-            "total_attempts": 0,
-            "total_questions": 0,
-            "total_correct": 0,
-            "last_attempt": None,
-            "companies_count": 0
+            "total_attempts": total_attempts,
+            "total_questions": total_questions,
+            "total_correct": total_correct,
+            "last_attempt": last_attempt,
+            "companies_count": companies_count
         }
 
-        with patch.object(QuizAttemptRepository, 'get_user_system_stats', new_callable=AsyncMock) as mock_get_stats:
-            mock_get_stats.return_value = stats_data
+        patched_repos.system_stats.return_value = stats_data
 
-            service = QuizAttemptService(mock_session)
-            result = await service.get_user_system_stats(mock_user)
+        result = await service.get_user_system_stats(mock_user)
 
-            assert result.stats.average_score == 0.0
-            assert result.companies_participated == 0
+        assert result.stats.total_attempts == total_attempts
+        assert result.stats.average_score == expected_average
+        assert result.companies_participated == companies_count
@@ -1,7 +1,5 @@
 import pytest
-from unittest.mock import AsyncMock, patch, MagicMock
-from uuid import uuid4
-from datetime import datetime, timezone
+from types import SimpleNamespace
 from fastapi import HTTPException
 from app.services.quiz_service import QuizService
 from app.repositories.company import CompanyRepository
@@ -9,478 +7,232 @@ from app.repositories.company_member import CompanyMemberRepository
 from app.repositories.quiz import QuizRepository
 from app.repositories.question import QuestionRepository
 from app.repositories.answer import AnswerRepository
-from app.models.user import User
-from app.models.company import Company
-from app.models.company_member import CompanyMember
-from app.models.quiz import Quiz
-from app.models.question import Question
-from app.models.answer import Answer
 from app.schemas.quiz import QuizCreate, QuizUpdate, QuestionCreate, AnswerCreate
+from tests.factories import fake_company, fake_member, fake_question, fake_quiz, fake_user, next_uuid
+from tests.helpers import assert_http, async_return
+
+
+@pytest.fixture
+def service(mock_session):
+    return QuizService(mock_session)
+
+
+@pytest.fixture(scope="module")
+def quiz_payload():
+    """Two-question QuizCreate payload, validated once and shared by the create-quiz tests"""
+    return QuizCreate(
+        title="Test Quiz",
+        description="Test Description",
+        questions=[
+            QuestionCreate(
+                title="Question 1",
+                order=0,
+                answers=[
+                    AnswerCreate(text="Answer 1", is_correct=True, order=0),
+                    AnswerCreate(text="Answer 2", is_correct=False, order=1)
+                ]
+            ),
+            QuestionCreate(
+                title="Question 2",
+                order=1,
+                answers=[
+                    AnswerCreate(text="Answer 3", is_correct=True, order=0),
+                    AnswerCreate(text="Answer 4", is_correct=False, order=1)
+                ]
+            )
+        ]
+    )
+
+
+@pytest.fixture
+def patched_repos(patch_repo):
+    """Every repository method the service touches, returning None unless a test sets it"""
+    company_repo = patch_repo(CompanyRepository, get_by_id=None)
+    member_repo = patch_repo(CompanyMemberRepository, get_by_user_and_company=None)
+    quiz_repo = patch_repo(QuizRepository, create=None, get_by_id=None, delete=None, get_quiz_with_questions=None)
+    return SimpleNamespace(
+        get_company=company_repo.get_by_id,
+        get_member=member_repo.get_by_user_and_company,
+        create_quiz=quiz_repo.create,
+        get_quiz=quiz_repo.get_by_id,
+        delete_quiz=quiz_repo.delete,
+        get_quiz_with_questions=quiz_repo.get_quiz_with_questions,
+        create_question=patch_repo(QuestionRepository, create=None).create,
+        create_answer=patch_repo(AnswerRepository, create=None).create,
+    )
 
 
-@pytest.mark.asyncio
 class TestQuizService:
     """Tests for QuizService"""
 
-    async def test_check_owner_or_admin_owner_has_access(self):
-        """Test that company owner has access"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        user_id = uuid4()
-
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=user_id,
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_company
-
-            service = QuizService(mock_session)
-            await service._check_owner_or_admin(company_id, user_id)
-
-            mock_get.assert_called_once_with(company_id)
-
-    async def test_check_owner_or_admin_admin_has_access(self):
-        """Test that company admin has access"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        owner_id = uuid4()
-        admin_id = uuid4()
-
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=owner_id,
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        mock_member = CompanyMember(
-            id=uuid4(),
-            user_id=admin_id,
-            company_id=company_id,
-            is_admin=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(CompanyMemberRepository, 'get_by_user_and_company',
-                              new_callable=AsyncMock) as mock_get_member:
-                mock_get_company.return_value = mock_company
-                mock_get_member.return_value = mock_member
-
-                service = QuizService(mock_session)
-                await service._check_owner_or_admin(company_id, admin_id)
-
-    async def test_check_owner_or_admin_company_not_found(self):
-        """Test that 404 raised when company doesn't exist"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        user_id = uuid4()
-
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = None
-
-            service = QuizService(mock_session)
-
-            with pytest.raises(HTTPException) as exc_info:
-                await service._check_owner_or_admin(company_id, user_id)
-
-            assert exc_info.value.status_code == 404
-            assert exc_info.value.detail == "Company not found"
-
-    async def test_check_owner_or_admin_regular_member_forbidden(self):
-        """Test that regular member without admin rights gets 403"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        owner_id = uuid4()
-        member_id = uuid4()
-
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=owner_id,
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+    @pytest.mark.parametrize("company_exists, is_owner, member_is_admin, error", [
+        (True, True, None, None),
+        (True, False, True, None),
+        (False, False, None, (404, "Company not found")),
+        (True, False, False, (403, "Only company owner or admin can perform this action")),
+    ], ids=["owner", "admin", "missing_company", "regular_member"])
+    async def test_check_owner_or_admin(
+            self, service, patched_repos, company_exists, is_owner, member_is_admin, error
+    ):
+        """Test owner and admins pass the access check, a missing company gives 404 and a regular member 403"""
+        company = fake_company()
+        user_id = company.owner_id if is_owner else next_uuid()
+
+        if company_exists:
+            patched_repos.get_company.return_value = company
+        if member_is_admin is not None:
+            patched_repos.get_member.return_value = fake_member(
+                user_id=user_id, company_id=company.id, is_admin=member_is_admin
+            )
+
+        if error is None:
+            await service._check_owner_or_admin(company.id, user_id)
+            patched_repos.get_company.assert_called_once_with(company.id)
+            return
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service._check_owner_or_admin(company.id, user_id)
+
+        assert_http(exc_info, *error)
+
+    async def test_create_quiz_success_by_owner(self, service, patched_repos, quiz_payload, monkeypatch):
+        """Test owner successfully creates quiz"""
+        company_id = next_uuid()
+        user_id = next_uuid()
 
-        mock_member = CompanyMember(
-            id=uuid4(),
-            user_id=member_id,
-            company_id=company_id,
-            is_admin=False,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        mock_user = fake_user(id=user_id, email="owner@test.com", username="owner")
 
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(CompanyMemberRepository, 'get_by_user_and_company',
-                              new_callable=AsyncMock) as mock_get_member:
-                mock_get_company.return_value = mock_company
-                mock_get_member.return_value = mock_member
+        mock_company = fake_company(id=company_id, owner_id=user_id)
 
-                service = QuizService(mock_session)
+        created_quiz = fake_quiz(company_id=company_id, title="Test Quiz", description="Test Description")
 
-                with pytest.raises(HTTPException) as exc_info:
-                    await service._check_owner_or_admin(company_id, member_id)
+        created_question = fake_question(quiz_id=created_quiz.id, title="Question 1")
+        created_quiz.questions = [created_question]
 
-                assert exc_info.value.status_code == 403
-                assert exc_info.value.detail == "Only company owner or admin can perform this action"
+        patched_repos.get_company.return_value = mock_company
+        patched_repos.create_quiz.return_value = created_quiz
+        patched_repos.create_question.return_value = created_question
+        patched_repos.get_quiz_with_questions.return_value = created_quiz
 
-    async def test_create_quiz_success_by_owner(self):
-        """Test owner successfully creates quiz"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        user_id = uuid4()
-
-        mock_user = User(
-            id=user_id,
-            email="owner@test.com",
-            username="owner",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
+        notify_quiz_created = async_return(5)
+        monkeypatch.setattr(
+            'app.services.notification_service.NotificationService',
+            lambda session: SimpleNamespace(notify_quiz_created=notify_quiz_created),
         )
 
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=user_id,
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        result = await service.create_quiz(company_id, quiz_payload, mock_user)
 
-        quiz_data = QuizCreate(
-            title="Test Quiz",
-            description="Test Description",
-            questions=[
-                QuestionCreate(
-                    title="Question 1",
-                    order=0,
-                    answers=[
-                        AnswerCreate(text="Answer 1", is_correct=True, order=0),
-                        AnswerCreate(text="Answer 2", is_correct=False, order=1)
-                    ]
-                ),
-                QuestionCreate(
-                    title="Question 2",
-                    order=1,
-                    answers=[
-                        AnswerCreate(text="Answer 3", is_correct=True, order=0),
-                        AnswerCreate(text="Answer 4", is_correct=False, order=1)
-                    ]
-                )
-            ]
-        )
-
-        created_quiz = Quiz(
-            id=uuid4(),
-            company_id=company_id,
-            title="Test Quiz",
-            description="Test Description",
-            frequency=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        assert result.title == "Test Quiz"
+        assert len(notify_quiz_created.calls) == 1
+        patched_repos.create_quiz.assert_called_once()
+        assert patched_repos.create_question.call_count == 2
+        assert patched_repos.create_answer.call_count == 4
 
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(QuizRepository, 'create', new_callable=AsyncMock) as mock_create_quiz:
-                with patch.object(QuestionRepository, 'create', new_callable=AsyncMock) as mock_create_question:
-                    with patch.object(AnswerRepository, 'create', new_callable=AsyncMock) as mock_create_answer:
-                        with patch.object(QuizRepository, 'get_quiz_with_questions',
-                                          new_callable=AsyncMock) as mock_get_quiz:
-                            with patch('app.services.notification_service.NotificationService') as mock_notif_service:
-                                mock_get_company.return_value = mock_company
-                                mock_create_quiz.return_value = created_quiz
-
-                                created_question = Question(
-                                    id=uuid4(),
-                                    quiz_id=created_quiz.id,
-                                    title="Question 1",
-                                    order=0,
-                                    created_at=datetime.now(timezone.utc),
-                                    updated_at=datetime.now(timezone.utc)
-                                )
-                                mock_create_question.return_value = created_question
-
-                                created_quiz.questions = [created_question]
-                                mock_get_quiz.return_value = created_quiz
-
-                                mock_notif_instance = AsyncMock()
-                                mock_notif_instance.notify_quiz_created = AsyncMock(return_value=5)
-                                mock_notif_service.return_value = mock_notif_instance
-
-                                service = QuizService(mock_session)
-                                result = await service.create_quiz(company_id, quiz_data, mock_user)
-
-                                assert result.title == "Test Quiz"
-                                mock_create_quiz.assert_called_once()
-                                assert mock_create_question.call_count == 2
-                                assert mock_create_answer.call_count == 4
-
-    async def test_create_quiz_forbidden_for_regular_member(self):
+    async def test_create_quiz_forbidden_for_regular_member(self, service, patched_repos, quiz_payload):
         """Test regular member cannot create quiz"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        owner_id = uuid4()
-        member_id = uuid4()
-
-        mock_user = User(
-            id=member_id,
-            email="member@test.com",
-            username="member",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        company_id = next_uuid()
+        owner_id = next_uuid()
+        member_id = next_uuid()
 
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=owner_id,
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        mock_user = fake_user(id=member_id, email="member@test.com", username="member")
 
-        mock_member = CompanyMember(
-            id=uuid4(),
-            user_id=member_id,
-            company_id=company_id,
-            is_admin=False,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        mock_company = fake_company(id=company_id, owner_id=owner_id)
 
-        quiz_data = QuizCreate(
-            title="Test Quiz",
-            questions=[
-                QuestionCreate(
-                    title="Question 1",
-                    order=0,
-                    answers=[
-                        AnswerCreate(text="Answer 1", is_correct=True, order=0),
-                        AnswerCreate(text="Answer 2", is_correct=False, order=1)
-                    ]
-                ),
-                QuestionCreate(
-                    title="Question 2",
-                    order=1,
-                    answers=[
-                        AnswerCreate(text="Answer 3", is_correct=True, order=0),
-                        AnswerCreate(text="Answer 4", is_correct=False, order=1)
-                    ]
-                )
-            ]
-        )
+        mock_member = fake_member(user_id=member_id, company_id=company_id, is_admin=False)
 
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(CompanyMemberRepository, 'get_by_user_and_company',
-                              new_callable=AsyncMock) as mock_get_member:
-                mock_get_company.return_value = mock_company
-                mock_get_member.return_value = mock_member
+        patched_repos.get_company.return_value = mock_company
+        patched_repos.get_member.return_value = mock_member
 
-                service = QuizService(mock_session)
+        with pytest.raises(HTTPException) as exc_info:
+            await service.create_quiz(company_id, quiz_payload, mock_user)
 
-                with pytest.raises(HTTPException) as exc_info:
-                    await service.create_quiz(company_id, quiz_data, mock_user)
+        assert exc_info.value.status_code == 403
 
-                assert exc_info.value.status_code == 403
-
-    async def test_delete_quiz_success_by_owner(self):
+    async def test_delete_quiz_success_by_owner(self, service, patched_repos):
         """Test owner successfully deletes quiz"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        quiz_id = uuid4()
-        user_id = uuid4()
-
-        mock_user = User(
-            id=user_id,
-            email="owner@test.com",
-            username="owner",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        company_id = next_uuid()
+        quiz_id = next_uuid()
+        user_id = next_uuid()
 
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=user_id,
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        mock_user = fake_user(id=user_id, email="owner@test.com", username="owner")
 
-        mock_quiz = Quiz(
-            id=quiz_id,
-            company_id=company_id,
-            title="Test Quiz",
-            frequency=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        mock_company = fake_company(id=company_id, owner_id=user_id)
+
+        mock_quiz = fake_quiz(id=quiz_id, company_id=company_id, title="Test Quiz")
 
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(QuizRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_quiz:
-                with patch.object(QuizRepository, 'delete', new_callable=AsyncMock) as mock_delete:
-                    mock_get_company.return_value = mock_company
-                    mock_get_quiz.return_value = mock_quiz
+        patched_repos.get_company.return_value = mock_company
+        patched_repos.get_quiz.return_value = mock_quiz
 
-                    service = QuizService(mock_session)
-                    await service.delete_quiz(company_id, quiz_id, mock_user)
+        await service.delete_quiz(company_id, quiz_id, mock_user)
 
-                    mock_delete.assert_called_once_with(mock_quiz)
+        patched_repos.delete_quiz.assert_called_once_with(mock_quiz)
 
-    async def test_delete_quiz_not_found(self):
+    async def test_delete_quiz_not_found(self, service, patched_repos):
         """Test delete fails when quiz doesn't exist"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        quiz_id = uuid4()
-        user_id = uuid4()
-
-        mock_user = User(
-            id=user_id,
-            email="owner@test.com",
-            username="owner",
-            is_active=True,
-            is_superuser=False,
-            hashed_password="hashed",
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        company_id = next_uuid()
+        quiz_id = next_uuid()
+        user_id = next_uuid()
 
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=user_id,
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        mock_user = fake_user(id=user_id, email="owner@test.com", username="owner")
 
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(QuizRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_quiz:
-                mock_get_company.return_value = mock_company
-                mock_get_quiz.return_value = None
+        mock_company = fake_company(id=company_id, owner_id=user_id)
 
-                service = QuizService(mock_session)
+        patched_repos.get_company.return_value = mock_company
 
-                with pytest.raises(HTTPException) as exc_info:
-                    await service.delete_quiz(company_id, quiz_id, mock_user)
+        with pytest.raises(HTTPException) as exc_info:
+            await service.delete_quiz(company_id, quiz_id, mock_user)
 
-                assert exc_info.value.status_code == 404
-                assert exc_info.value.detail == "Quiz not found"
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Quiz not found"
 
-    async def test_get_company_quizzes_success(self):
+    async def test_get_company_quizzes_success(self, service, patched_repos, patch_repo):
         """Test getting company quizzes returns list"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-
-        mock_company = Company(
-            id=company_id,
-            name="Test Company",
-            owner_id=uuid4(),
-            is_visible=True,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
+        company_id = next_uuid()
 
-        mock_quiz = Quiz(
-            id=uuid4(),
-            company_id=company_id,
-            title="Test Quiz",
-            frequency=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-        mock_quiz.questions = []
+        mock_company = fake_company(id=company_id, owner_id=next_uuid())
 
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get_company:
-            with patch.object(QuizRepository, 'get_company_quizzes', new_callable=AsyncMock) as mock_get_quizzes:
-                with patch.object(QuizRepository, 'count_company_quizzes', new_callable=AsyncMock) as mock_count:
-                    with patch.object(QuizRepository, 'get_quiz_with_questions',
-                                      new_callable=AsyncMock) as mock_get_complete:
-                        mock_get_company.return_value = mock_company
-                        mock_get_quizzes.return_value = [mock_quiz]
-                        mock_count.return_value = 1
-                        mock_get_complete.return_value = mock_quiz
+        mock_quiz = fake_quiz(company_id=company_id, title="Test Quiz")
 
-                        service = QuizService(mock_session)
-                        result = await service.get_company_quizzes(company_id, skip=0, limit=100)
+        patched_repos.get_company.return_value = mock_company
+        patch_repo(QuizRepository, get_company_quizzes=[mock_quiz], count_company_quizzes=1)
+        patched_repos.get_quiz_with_questions.return_value = mock_quiz
 
-                        assert result.total == 1
-                        assert len(result.quizzes) == 1
+        result = await service.get_company_quizzes(company_id, skip=0, limit=100)
 
-    async def test_get_company_quizzes_company_not_found(self):
-        """Test get quizzes fails when company doesn't exist"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
+        assert result.total == 1
+        assert len(result.quizzes) == 1
 
-        with patch.object(CompanyRepository, 'get_by_id', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = None
-
-            service = QuizService(mock_session)
+    async def test_get_company_quizzes_company_not_found(self, service, patched_repos):
+        """Test get quizzes fails when company doesn't exist"""
+        company_id = next_uuid()
 
-            with pytest.raises(HTTPException) as exc_info:
-                await service.get_company_quizzes(company_id)
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_company_quizzes(company_id)
 
-            assert exc_info.value.status_code == 404
-            assert exc_info.value.detail == "Company not found"
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Company not found"
 
-    async def test_get_quiz_success(self):
+    async def test_get_quiz_success(self, service, patched_repos):
         """Test getting quiz by ID returns quiz with questions"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        quiz_id = uuid4()
-
-        mock_quiz = Quiz(
-            id=quiz_id,
-            company_id=company_id,
-            title="Test Quiz",
-            frequency=0,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc)
-        )
-        mock_quiz.questions = []
-
-        with patch.object(QuizRepository, 'get_quiz_with_questions', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = mock_quiz
+        company_id = next_uuid()
+        quiz_id = next_uuid()
 
-            service = QuizService(mock_session)
-            result = await service.get_quiz(company_id, quiz_id)
+        mock_quiz = fake_quiz(id=quiz_id, company_id=company_id, title="Test Quiz")
 
-            assert result.id == quiz_id
-            assert result.title == "Test Quiz"
+        patched_repos.get_quiz_with_questions.return_value = mock_quiz
 
-    async def test_get_quiz_not_found(self):
-        """Test get quiz fails when quiz doesn't exist"""
-        mock_session = AsyncMock()
-        company_id = uuid4()
-        quiz_id = uuid4()
+        result = await service.get_quiz(company_id, quiz_id)
 
-        with patch.object(QuizRepository, 'get_quiz_with_questions', new_callable=AsyncMock) as mock_get:
-            mock_get.return_value = None
+        assert result.id == quiz_id
+        assert result.title == "Test Quiz"
 
-            service = QuizService(mock_session)
+    async def test_get_quiz_not_found(self, service, patched_repos):
+        """Test get quiz fails when quiz doesn't exist"""
+        company_id = next_uuid()
+        quiz_id = next_uuid()
 
-            with pytest.raises(HTTPException) as exc_info:
-                await service.get_quiz(company_id, quiz_id)
+        with pytest.raises(HTTPException) as exc_info:
+            await service.get_quiz(company_id, quiz_id)
 
-            assert exc_info.value.status_code == 404
-            assert exc_info.value.detail == "Quiz not found"
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.detail == "Quiz not found"
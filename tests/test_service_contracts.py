@@ -0,0 +1,126 @@
+"""
+Contract tests: services, repositories and schemas expose the expected API
+"""
+import functools
+import importlib
+
+import pytest
+
+
+CONTRACTS = [
+    (
+        "app.services.company:CompanyService",
+        ["create_company", "get_all_companies", "get_company_by_id", "update_company", "delete_company"],
+    ),
+    (
+        "app.services.company_invitation_service:CompanyInvitationService",
+        [
+            "create_invitation", "cancel_invitation", "get_company_invitations",
+            "get_user_invitations", "accept_invitation", "decline_invitation",
+        ],
+    ),
+    (
+        "app.services.company_request_service:CompanyRequestService",
+        [
+            "create_request", "cancel_request", "get_company_requests",
+            "get_user_requests", "accept_request", "decline_request",
+        ],
+    ),
+    (
+        "app.services.company_member_service:CompanyMemberService",
+        [
+            "get_company_members", "remove_member", "leave_company",
+            "promote_to_admin", "demote_from_admin", "get_company_admins",
+        ],
+    ),
+    (
+        "app.services.notification_service:NotificationService",
+        [
+            "get_user_notifications", "get_unread_count", "mark_notification_as_read",
+            "mark_all_as_read", "notify_quiz_created",
+        ],
+    ),
+    (
+        "app.services.export_service:ExportService",
+        [
+            "export_user_responses", "export_company_user_responses", "export_quiz_responses",
+            "_check_owner_or_admin", "_response_to_json", "_response_to_csv",
+        ],
+    ),
+    (
+        "app.services.quiz_service:QuizService",
+        [
+            "create_quiz", "update_quiz", "delete_quiz",
+            "get_company_quizzes", "get_quiz", "_check_owner_or_admin",
+        ],
+    ),
+    (
+        "app.services.quiz_attempt_service:QuizAttemptService",
+        ["submit_quiz", "get_user_company_stats", "get_user_system_stats"],
+    ),
+    (
+        "app.services.redis_service:RedisService",
+        [
+            "store_quiz_response", "get_question_response", "get_user_quiz_responses",
+            "delete_quiz_responses", "_make_key", "_make_pattern",
+        ],
+    ),
+    (
+        "app.services.scheduled_quiz_reminder:ScheduledQuizReminderService",
+        ["check_and_notify_pending_quizzes", "_send_reminder_notification"],
+    ),
+    (
+        "app.repositories.company_member:CompanyMemberRepository",
+        ["get_company_admins", "count_company_admins"],
+    ),
+    (
+        "app.repositories.quiz:QuizRepository",
+        ["get_company_quizzes", "count_company_quizzes", "get_quiz_with_questions"],
+    ),
+    (
+        "app.repositories.quiz_attempt:QuizAttemptRepository",
+        [
+            "get_user_attempts", "get_user_company_attempts", "get_last_attempt",
+            "get_user_company_stats", "get_user_system_stats",
+        ],
+    ),
+    (
+        "app.repositories.scheduled_check:ScheduledCheckRepository",
+        [
+            "get_all_active_users", "get_user_available_quizzes", "get_last_quiz_attempt_time",
+            "get_users_pending_quizzes", "get_company_name",
+        ],
+    ),
+    ("app.repositories.question", ["QuestionRepository"]),
+    ("app.repositories.answer", ["AnswerRepository"]),
+    ("app.models.quiz_attempt:QuizAttempt", ["user", "quiz", "company"]),
+    ("app.schemas.quiz:QuizResponseDetail", ["from_redis"]),
+    (
+        "app.schemas.company_action",
+        [
+            "InvitationCreate", "InvitationResponse", "InvitationList",
+            "RequestResponse", "RequestList", "MemberResponse", "MemberList",
+        ],
+    ),
+]
+
+
+@functools.cache
+def _load(target: str):
+    """Import 'module' or 'module:Name' once and return the object"""
+    module_path, _, name = target.partition(":")
+    module = importlib.import_module(module_path)
+    return getattr(module, name) if name else module
+
+
+@pytest.mark.parametrize("target, attrs", CONTRACTS, ids=[target for target, _ in CONTRACTS])
+def test_contract(target, attrs):
+    """Test that target object defines all required attributes"""
+    obj = _load(target)
+
+    missing = [attr for attr in attrs if not hasattr(obj, attr)]
+    assert not missing, f"{target} is missing {missing}"
+
+    # Model relationships are attributes, not methods
+    if isinstance(obj, type) and not hasattr(obj, "__mapper__"):
+        assert all(callable(getattr(obj, attr)) for attr in attrs)
@@ -3,45 +3,44 @@ Tests for user validation - users can only edit/delete their own profiles
 """
 import pytest
 
+from app.schemas.user import UserSelfUpdateRequest
+from app.services.user import UserService
 
-def test_user_self_update_schema_only_allows_username_and_password():
-    """Test UserSelfUpdateRequest schema only accepts username and password"""
-    from app.schemas.user import UserSelfUpdateRequest
+SELF_UPDATE = UserSelfUpdateRequest(username="newuser", password="newpass123")
 
-    valid_request = UserSelfUpdateRequest(username="newuser", password="newpass123")
-    assert valid_request.username == "newuser"
-    assert valid_request.password == "newpass123"
-
-    assert not hasattr(valid_request, 'email')
-    assert not hasattr(valid_request, 'is_active')
 
+@pytest.fixture(scope="module")
+def users_routes():
+    """HTTP method sets of each users router route, grouped by path and built once"""
+    from app.api.routes.users import router
 
-def test_user_service_has_validation_methods():
-    """Test that UserService has update_self and delete_self methods"""
-    from app.services.user import UserService
+    routes = {}
+    for route in router.routes:
+        routes.setdefault(route.path, []).append(route.methods)
+    return routes
 
-    assert hasattr(UserService, 'update_self')
-    assert hasattr(UserService, 'delete_self')
-    assert callable(getattr(UserService, 'update_self'))
-    assert callable(getattr(UserService, 'delete_self'))
 
+def test_user_self_update_schema_accepts_username_and_password():
+    """Test UserSelfUpdateRequest keeps the username and password it is given"""
+    assert (SELF_UPDATE.username, SELF_UPDATE.password) == ("newuser", "newpass123")
 
-def test_validation_endpoints_are_registered():
-    """Test that /users/me endpoints exist"""
-    from app.api.routes.users import router
 
-    routes = [route.path for route in router.routes]
+@pytest.mark.parametrize("obj, attr, expected", [
+    (UserService, "update_self", True),
+    (UserService, "delete_self", True),
+    (SELF_UPDATE, "email", False),
+    (SELF_UPDATE, "is_active", False),
+], ids=["service-update_self", "service-delete_self", "schema-no-email", "schema-no-is_active"])
+def test_self_service_api_surface(obj, attr, expected):
+    """Test UserService has self-service methods and UserSelfUpdateRequest only allows username and password"""
+    assert hasattr(obj, attr) is expected
+    if expected:
+        assert callable(getattr(obj, attr))
 
-    assert "/users/me" in routes
 
-    me_routes = [route for route in router.routes if route.path == "/users/me"]
+def test_validation_endpoints_are_registered(users_routes):
+    """Test that /users/me endpoints exist"""
+    me_routes = users_routes.get("/users/me", [])
 
     assert len(me_routes) == 3
-
-    all_methods = set()
-    for route in me_routes:
-        all_methods.update(route.methods)
-
-    assert "GET" in all_methods
-    assert "PUT" in all_methods
-    assert "DELETE" in all_methods
+    assert {"GET", "PUT", "DELETE"} <= set().union(*me_routes)